@@ -0,0 +1,37 @@
+"""Rename the normalized phone column to phone_digits
+
+Revision ID: 1e8b4c7f2a95
+Revises: 5d7e9a1c3f28
+Create Date: 2025-02-27 11:04:18.392716
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1e8b4c7f2a95'
+down_revision: Union[str, None] = '5d7e9a1c3f28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The column holds the bare digits of the number, no country code is
+    # applied, so it is not E.164
+    op.alter_column('contacts', 'phone_e164', new_column_name='phone_digits')
+    op.execute("UPDATE contacts SET phone_digits = ltrim(phone_digits, '+')")
+    op.execute(
+        "ALTER INDEX ix_contacts_user_id_phone_e164 "
+        "RENAME TO ix_contacts_user_id_phone_digits"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER INDEX ix_contacts_user_id_phone_digits "
+        "RENAME TO ix_contacts_user_id_phone_e164"
+    )
+    op.execute("UPDATE contacts SET phone_digits = '+' || phone_digits")
+    op.alter_column('contacts', 'phone_digits', new_column_name='phone_e164')
@@ -0,0 +1,28 @@
+"""Add composite index for contacts keyset pagination
+
+Revision ID: 3c9e51a7d2b4
+Revises: 7ad43030187f
+Create Date: 2025-02-10 10:12:41.518302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9e51a7d2b4'
+down_revision: Union[str, None] = '7ad43030187f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_contacts_user_id_id', 'contacts', ['user_id', 'id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contacts_user_id_id', table_name='contacts')
@@ -0,0 +1,50 @@
+"""Add normalized phone and email columns for exact contact lookups
+
+Revision ID: 4a6d0e2b9c71
+Revises: e7c3f9a0b215
+Create Date: 2025-02-19 15:22:47.603158
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4a6d0e2b9c71'
+down_revision: Union[str, None] = 'e7c3f9a0b215'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'contacts', sa.Column('phone_e164', sa.String(length=16), nullable=True)
+    )
+    op.add_column(
+        'contacts',
+        sa.Column('email_lower', sa.String(length=100), nullable=True)
+    )
+    op.execute(
+        "UPDATE contacts SET "
+        "phone_e164 = '+' || regexp_replace(phone, '\\D', '', 'g'), "
+        "email_lower = lower(trim(email))"
+    )
+    op.alter_column('contacts', 'phone_e164', nullable=False)
+    op.alter_column('contacts', 'email_lower', nullable=False)
+    op.create_index(
+        'ix_contacts_user_id_phone_e164', 'contacts',
+        ['user_id', 'phone_e164'], unique=False
+    )
+    op.create_index(
+        'ix_contacts_user_id_email_lower', 'contacts',
+        ['user_id', 'email_lower'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contacts_user_id_email_lower', table_name='contacts')
+    op.drop_index('ix_contacts_user_id_phone_e164', table_name='contacts')
+    op.drop_column('contacts', 'email_lower')
+    op.drop_column('contacts', 'phone_e164')
@@ -0,0 +1,39 @@
+"""Add id to the display name prefix index
+
+Revision ID: 5d7e9a1c3f28
+Revises: c8f1a2d4e6b0
+Create Date: 2025-02-26 09:31:42.106583
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d7e9a1c3f28'
+down_revision: Union[str, None] = 'c8f1a2d4e6b0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DISPLAY_NAME = sa.text("lower(name || ' ' || surname) text_pattern_ops")
+
+
+def upgrade() -> None:
+    # Suggestions are ordered by display name, then id
+    op.create_index(
+        'ix_contacts_user_id_display_name_id', 'contacts',
+        ['user_id', DISPLAY_NAME, 'id'], unique=False
+    )
+    op.drop_index('ix_contacts_user_id_display_name', table_name='contacts')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_contacts_user_id_display_name', 'contacts',
+        ['user_id', DISPLAY_NAME], unique=False
+    )
+    op.drop_index(
+        'ix_contacts_user_id_display_name_id', table_name='contacts'
+    )
@@ -0,0 +1,30 @@
+"""Add prefix index on contact display names for suggestions
+
+Revision ID: 9b3e5f7a1d24
+Revises: 4a6d0e2b9c71
+Create Date: 2025-02-21 10:07:15.418902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b3e5f7a1d24'
+down_revision: Union[str, None] = '4a6d0e2b9c71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_contacts_user_id_display_name', 'contacts',
+        ['user_id', sa.text("lower(name || ' ' || surname) text_pattern_ops")],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contacts_user_id_display_name', table_name='contacts')
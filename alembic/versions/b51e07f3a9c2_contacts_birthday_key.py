@@ -0,0 +1,39 @@
+"""Add indexed birthday_key column to contacts
+
+Revision ID: b51e07f3a9c2
+Revises: 8f4b2d6c1e90
+Create Date: 2025-02-12 14:03:22.871546
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b51e07f3a9c2'
+down_revision: Union[str, None] = '8f4b2d6c1e90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'contacts', sa.Column('birthday_key', sa.Integer(), nullable=True)
+    )
+    op.execute(
+        'UPDATE contacts SET birthday_key = '
+        'CAST(EXTRACT(MONTH FROM birthday) * 100 '
+        '+ EXTRACT(DAY FROM birthday) AS INTEGER)'
+    )
+    op.alter_column('contacts', 'birthday_key', nullable=False)
+    op.create_index(
+        'ix_contacts_user_id_birthday_key', 'contacts',
+        ['user_id', 'birthday_key'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contacts_user_id_birthday_key', table_name='contacts')
+    op.drop_column('contacts', 'birthday_key')
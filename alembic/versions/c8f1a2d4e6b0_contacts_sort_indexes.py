@@ -0,0 +1,34 @@
+"""Add composite indexes for sorting the contact list
+
+Revision ID: c8f1a2d4e6b0
+Revises: 9b3e5f7a1d24
+Create Date: 2025-02-24 13:48:09.271634
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8f1a2d4e6b0'
+down_revision: Union[str, None] = '9b3e5f7a1d24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (user_id, updated_at, id) already exists for the changes feed
+SORT_KEYS = ('name', 'surname', 'birthday', 'created_at')
+
+
+def upgrade() -> None:
+    for key in SORT_KEYS:
+        op.create_index(
+            f'ix_contacts_user_id_{key}_id', 'contacts',
+            ['user_id', key, 'id'], unique=False
+        )
+
+
+def downgrade() -> None:
+    for key in reversed(SORT_KEYS):
+        op.drop_index(f'ix_contacts_user_id_{key}_id', table_name='contacts')
@@ -0,0 +1,38 @@
+"""Scope contact email and phone uniqueness to the owner
+
+Revision ID: d2a8c4f61b37
+Revises: b51e07f3a9c2
+Create Date: 2025-02-14 11:26:50.094417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a8c4f61b37'
+down_revision: Union[str, None] = 'b51e07f3a9c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_contacts_user_id_email', 'contacts', ['user_id', 'email'],
+        unique=True
+    )
+    op.create_index(
+        'ix_contacts_user_id_phone', 'contacts', ['user_id', 'phone'],
+        unique=True
+    )
+    op.drop_constraint('contacts_email_key', 'contacts', type_='unique')
+    op.drop_constraint('contacts_phone_key', 'contacts', type_='unique')
+
+
+def downgrade() -> None:
+    op.create_unique_constraint('contacts_phone_key', 'contacts', ['phone'])
+    op.create_unique_constraint('contacts_email_key', 'contacts', ['email'])
+    op.drop_index('ix_contacts_user_id_phone', table_name='contacts')
+    op.drop_index('ix_contacts_user_id_email', table_name='contacts')
@@ -0,0 +1,52 @@
+"""Add deleted contacts tombstones and the changes feed index
+
+Revision ID: e7c3f9a0b215
+Revises: d2a8c4f61b37
+Create Date: 2025-02-17 09:41:03.226815
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7c3f9a0b215'
+down_revision: Union[str, None] = 'd2a8c4f61b37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Rows without updated_at would never show up in the changes feed
+    op.execute(
+        "UPDATE contacts SET updated_at = COALESCE(created_at, now()) "
+        "WHERE updated_at IS NULL"
+    )
+    op.create_table(
+        'deleted_contacts',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('contact_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_deleted_contacts_user_id_deleted_at_id', 'deleted_contacts',
+        ['user_id', 'deleted_at', 'id'], unique=False
+    )
+    op.create_index(
+        'ix_contacts_user_id_updated_at_id', 'contacts',
+        ['user_id', 'updated_at', 'id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contacts_user_id_updated_at_id', table_name='contacts')
+    op.drop_index(
+        'ix_deleted_contacts_user_id_deleted_at_id',
+        table_name='deleted_contacts'
+    )
+    op.drop_table('deleted_contacts')
@@ -1,3 +1,5 @@
+import asyncio
+
 from alembic import command
 from alembic.config import Config
 from fastapi import FastAPI, Request
@@ -6,8 +8,11 @@ from slowapi.errors import RateLimitExceeded
 from starlette.responses import JSONResponse
 
 from src.api import auth, contacts, users, utils
+from src.services.events import contact_events
+from src.services.hashing import hashing_pool
 from src.services.limiter import limiter
 from src.services.redis_cache import redis_cache
+from src.services.user_cache import listen_user_invalidations
 
 import logging
 import sys
@@ -78,10 +83,25 @@ async def run_migrations():
 @app.on_event("startup")
 async def startup_event():
     """
-    Run database migrations when the application starts.
+    Run database migrations and start listening for user cache
+    invalidations when the application starts.
     """
     await run_migrations()
     await redis_cache.connect()
+    app.state.user_listener = asyncio.create_task(
+        listen_user_invalidations()
+    )
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """
+    Stop the event listeners and the password hashing threads.
+    """
+    app.state.user_listener.cancel()
+    contact_events.close()
+    hashing_pool.shutdown()
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -4,11 +4,17 @@ from fastapi import (APIRouter, BackgroundTasks, Depends, HTTPException,
 from sqlalchemy.orm import Session
 
 from src.database.database import get_db
-from src.schemas.users import RequestEmail, Token, User, UserCreate, UserLogin, ResetPassword, UserCacheModel
-from src.services.auth import create_access_token, get_email_from_token, Hash
+from src.schemas.users import RequestEmail, Token, User, UserCreate, UserLogin, ResetPassword
+from src.services.auth import (
+    Hash,
+    create_access_token,
+    get_email_from_token,
+    revoke_tokens,
+    user_claims,
+)
 from src.services.email import send_email,send_reset_password_email
 from src.services.users import UserService
-from src.services.redis_cache import redis_cache
+from src.services.user_cache import cache_user
 
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -56,7 +62,9 @@ async def register_user(
             status_code=status.HTTP_409_CONFLICT,
             detail="A user with this username already exists.",
         )
-    user_data.password = Hash().get_password_hash(user_data.password)
+    user_data.password = await Hash().get_password_hash_async(
+        user_data.password
+    )
     new_user = await user_service.create_user(user_data)
     background_tasks.add_task(
         send_email, new_user.email, new_user.username, request.base_url
@@ -87,27 +95,18 @@ async def login_user(body: UserLogin, db: Session = Depends(get_db)):
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Email is not verified.",
         )
-    if not user or not Hash().verify_password(body.password,
-                                              user.hashed_password):
+    if not user or not await Hash().verify_password_async(
+        body.password, user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password.",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    access_token = await create_access_token(data={"sub": user.username})
-
-    cached_user = UserCacheModel(
-        id=user.id,
-        username=user.username,
-        email=user.email,
-        is_verified=user.is_verified,
-        role=user.role
-    ).dict()
+    access_token = await create_access_token(data=await user_claims(user))
 
-    if redis_cache.redis:
-        await redis_cache.set(f"user:{user.username}", cached_user,
-                              expire=3600)
+    await cache_user(user)
 
     return {"access_token": access_token, "token_type": "bearer"}
 
@@ -242,7 +241,10 @@ async def reset_password(token: str, body: ResetPassword, db: Session = Depends(
         )
 
     # Хешування нового пароля
-    hashed_password = Hash().get_password_hash(body.new_password)
+    hashed_password = await Hash().get_password_hash_async(
+        body.new_password
+    )
     await user_service.reset_password(user.id, hashed_password)
+    await revoke_tokens(user.id)
 
     return {"message": "Password successfully changed"}
@@ -1,28 +1,212 @@
-from typing import List
+import json
+from datetime import date
+from typing import Any, Awaitable, Callable, Dict, List, Literal
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    File,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.database import get_db
 from src.database.models import User
-from src.schemas.contacts import ContactModel, ContactResponse
+from src.schemas.contacts import (
+    BulkContactResponse,
+    ContactBatch,
+    ContactChanges,
+    ContactModel,
+    ContactResponse,
+    ContactSuggestion,
+    ContactUpdate,
+    ImportContactsResponse,
+    ImportProgress,
+)
 from src.services.auth import get_current_user
 from src.services.contacts import ContactService
+from src.services.idempotency import IdempotencyStore, request_fingerprint
 
 router = APIRouter()
 
 
+def _not_modified(request: Request, etag: str) -> bool:
+    """
+    Check whether the client already has the representation `etag`.
+
+    Args:
+        request (Request): Incoming request with `If-None-Match`.
+        etag (str): Current ETag of the resource.
+
+    Returns:
+        bool: True if the request's `If-None-Match` matches the ETag.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return "*" in tags or etag in tags
+
+
+async def _conditional_read(
+    request: Request,
+    response: Response,
+    service: ContactService,
+    user: User,
+    route: str,
+    load: Callable[[], Awaitable[Any]],
+    **params,
+):
+    """
+    Serve a contacts read with ETag and `If-None-Match` support.
+
+    When Redis is available the ETag comes from the user's contacts
+    version, so an unchanged resource is answered with 304 before any
+    query runs. Otherwise the ETag is a hash of the loaded data.
+
+    The service already returns JSON-ready data, so it is sent as is
+    instead of being validated again against `response_model`.
+
+    Args:
+        request (Request): Incoming request.
+        response (Response): Outgoing response, used to set the ETag.
+        service (ContactService): Contact service of the request.
+        user (User): The authenticated user.
+        route (str): Name of the read ("list", "contact", ...).
+        load (Callable): Coroutine function loading the response data.
+        **params: Extra values the response depends on.
+
+    Returns:
+        Response: JSON response with the loaded data, or an empty 304.
+    """
+    params = {**request.path_params, **request.query_params, **params}
+    etag = await service.get_etag(route, user, params)
+    if etag and _not_modified(request, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+    data = await load()
+    etag = etag or service.content_etag(data)
+    if _not_modified(request, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    response.headers["ETag"] = etag
+    return JSONResponse(content=data, headers=dict(response.headers))
+
+
+def _replayed(stored: dict) -> JSONResponse:
+    """
+    Build the response replaying a stored idempotent response.
+
+    Args:
+        stored (dict): Stored `status` and `body`.
+
+    Returns:
+        JSONResponse: The stored response.
+    """
+    return JSONResponse(
+        content=stored["body"],
+        status_code=stored["status"],
+        headers={"Idempotent-Replayed": "true"},
+    )
+
+
+async def _idempotent(
+    request: Request,
+    user: User,
+    key: str | None,
+    body: BaseModel,
+    status_code: int,
+    mutate: Callable[[], Awaitable[Any]],
+):
+    """
+    Run a contact mutation at most once per `Idempotency-Key`.
+
+    Without a key the mutation simply runs. With a key, a retry gets the
+    stored response of the first request (marked with an
+    `Idempotent-Replayed` header), a concurrent retry gets 409 and a
+    different request reusing the key gets 422. Client errors are
+    stored as well, so a retry cannot turn a rejected request into an
+    accepted one.
+
+    Args:
+        request (Request): Incoming request.
+        user (User): The authenticated user.
+        key (str, optional): Value of the `Idempotency-Key` header.
+        body (BaseModel): Validated request body.
+        status_code (int): Status of a successful response.
+        mutate (Callable): Coroutine function running the mutation and
+        returning the contact.
+
+    Returns:
+        The contact, or a JSON response when a key is given.
+    """
+    if key is None:
+        return await mutate()
+
+    store = IdempotencyStore(user, key)
+    fingerprint = request_fingerprint(
+        request.method,
+        request.url.path,
+        body.model_dump(mode="json", exclude_unset=True),
+    )
+    stored = await store.replay(fingerprint)
+    if stored is not None:
+        return _replayed(stored)
+
+    await store.lock()
+    try:
+        # The first request may have finished between replay and lock
+        stored = await store.replay(fingerprint)
+        if stored is not None:
+            return _replayed(stored)
+        try:
+            contact = await mutate()
+        except HTTPException as e:
+            if e.status_code >= 500:
+                raise
+            status_code, content = e.status_code, {"detail": e.detail}
+        else:
+            content = ContactResponse.model_validate(contact).model_dump(
+                mode="json"
+            )
+        await store.save(fingerprint, status_code, content)
+    finally:
+        await store.unlock()
+    return JSONResponse(content=content, status_code=status_code)
+
+
 @router.post("/contacts/", response_model=ContactResponse, status_code=status.HTTP_201_CREATED)
 async def create_contact(
     body: ContactModel,
+    request: Request,
+    idempotency_key: str = Header(
+        None, alias="Idempotency-Key", max_length=255
+    ),
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
     """
     Create a new contact for an authenticated user.
 
+    Retries sent with the same `Idempotency-Key` header replay the first
+    response instead of creating the contact again.
+
     Args:
         body (ContactModel): The contact data to create.
+        request (Request): Incoming request.
+        idempotency_key (str, optional): Client-chosen key of the request.
         db (AsyncSession): Database session dependency.
         user (User): The authenticated user.
 
@@ -30,30 +214,127 @@ async def create_contact(
         ContactResponse: The created contact details.
     """
     service = ContactService(db)
-    return await service.create_contact(body, user)
+    return await _idempotent(
+        request, user, idempotency_key, body, status.HTTP_201_CREATED,
+        lambda: service.create_contact(body, user),
+    )
+
+
+@router.post("/contacts/bulk", response_model=BulkContactResponse)
+async def create_contacts_bulk(
+    body: List[Dict[str, Any]] = Body(...),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """
+    Create many contacts for an authenticated user in one request.
+
+    Every item is validated on its own; invalid items and contacts that
+    already exist are reported instead of failing the whole request.
+
+    Args:
+        body (List[Dict[str, Any]]): Contact payloads to create.
+        db (AsyncSession): Database session dependency.
+        user (User): The authenticated user.
+
+    Returns:
+        BulkContactResponse: Counters and a result for every item.
+    """
+    service = ContactService(db)
+    return await service.create_contacts_bulk(body, user)
+
+
+@router.post("/contacts/import", response_model=ImportContactsResponse)
+async def import_contacts(
+    file: UploadFile = File(),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """
+    Import contacts from a CSV or vCard file.
+
+    Existing contacts are skipped; rows that fail validation are listed
+    in the report.
+
+    Args:
+        file (UploadFile): CSV or vCard file to import.
+        db (AsyncSession): Database session dependency.
+        user (User): The authenticated user.
+
+    Returns:
+        ImportContactsResponse: Counters and per-row validation errors.
+    """
+    service = ContactService(db)
+    return await service.import_contacts(file, user)
+
+
+@router.get("/contacts/import/progress", response_model=ImportProgress)
+async def import_progress(
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """
+    Retrieve the progress of the latest contacts import.
+
+    Args:
+        db (AsyncSession): Database session dependency.
+        user (User): The authenticated user.
+
+    Returns:
+        ImportProgress: Number of processed and invalid rows so far.
+    """
+    service = ContactService(db)
+    return await service.get_import_progress(user)
 
 
 @router.get("/contacts/", response_model=List[ContactResponse])
 async def read_contacts(
+    request: Request,
+    response: Response,
     name: str = Query(None),
     surname: str = Query(None),
     email: str = Query(None),
     skip: int = 0,
     limit: int = 10,
+    cursor: str = Query(None),
+    q: str = Query(None),
+    fields: str = Query(None),
+    sort: Literal[
+        "id", "name", "surname", "birthday", "created_at", "updated_at"
+    ] = Query("id"),
+    order: Literal["asc", "desc"] = Query("asc"),
+    count: bool = Query(False),
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
     """
     Retrieve a list of contacts for the authenticated user.
 
-    Supports filtering by name, surname, and email.
+    Supports filtering by name, surname, and email, and a `q` search
+    over all three ordered by relevance. Pages can be walked
+    either with `skip` or with the `cursor` token returned in the
+    `X-Next-Cursor` response header of the previous page. Contacts are
+    sorted by `sort` in `order` direction, with ties broken by ID.
+    `fields` limits the returned fields, e.g. `fields=name,phone`; the
+    ID and the sort field are always returned. With `count=true` the
+    number of matching contacts is sent in `X-Total-Count`; filtered
+    counts may be estimates, flagged by `X-Total-Count-Estimated`.
+    Responds with 304 when `If-None-Match` matches the current ETag.
 
     Args:
+        request (Request): Incoming request.
+        response (Response): Outgoing response, used to set headers.
         name (str, optional): Filter by contact's name.
         surname (str, optional): Filter by contact's surname.
         email (str, optional): Filter by contact's email.
         skip (int, optional): Number of contacts to skip (pagination).
         limit (int, optional): Maximum number of contacts to return.
+        cursor (str, optional): Cursor of the next page; overrides `skip`.
+        q (str, optional): Search term for name, surname and email.
+        fields (str, optional): Comma-separated fields to return.
+        sort (str, optional): Field to sort by. Defaults to "id".
+        order (str, optional): "asc" (default) or "desc".
+        count (bool, optional): Send the total in `X-Total-Count`.
         db (AsyncSession): Database session dependency.
         user (User): The authenticated user.
 
@@ -61,20 +342,231 @@ async def read_contacts(
         List[ContactResponse]: A list of contact details.
     """
     service = ContactService(db)
-    return await service.get_contacts(name, surname, email, skip, limit, user)
+
+    async def load():
+        contacts = await service.get_contacts(
+            name, surname, email, skip, limit, user, cursor, q, fields,
+            sort, order,
+        )
+        next_cursor = service.next_cursor(contacts, limit, q, sort)
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+        if count:
+            total, exact = await service.count_contacts(
+                user, name, surname, email, q
+            )
+            response.headers["X-Total-Count"] = str(total)
+            if not exact:
+                response.headers["X-Total-Count-Estimated"] = "true"
+        return contacts
+
+    return await _conditional_read(
+        request, response, service, user, "list", load
+    )
+
+
+@router.get("/contacts/export")
+async def export_contacts(
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """
+    Export all contacts of the authenticated user.
+
+    Rows are streamed from a server-side cursor, so memory use does not
+    grow with the size of the address book.
+
+    Args:
+        export_format (str, optional): "ndjson" (default) or "csv".
+        db (AsyncSession): Database session dependency.
+        user (User): The authenticated user.
+
+    Returns:
+        StreamingResponse: The contacts in the requested format.
+    """
+    service = ContactService(db)
+    media_type = {
+        "ndjson": "application/x-ndjson",
+        "csv": "text/csv",
+    }[export_format]
+    return StreamingResponse(
+        service.export_contacts(user, export_format),
+        media_type=media_type,
+        headers={
+            "Content-Disposition":
+                f'attachment; filename="contacts.{export_format}"'
+        },
+    )
+
+
+@router.get("/contacts/changes", response_model=ContactChanges)
+async def contact_changes(
+    since: str = Query(None),
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """
+    Retrieve the contacts changed since the previous sync.
+
+    Returns the contacts created or updated after the `since` token and
+    the IDs of the contacts deleted after it, together with the token
+    for the next sync. Without `since` all contacts are returned. Keep
+    calling while `has_more` is true.
+
+    Args:
+        since (str, optional): `next` token of the previous response.
+        limit (int, optional): Maximum number of changed and of deleted
+        contacts per response.
+        db (AsyncSession): Database session dependency.
+        user (User): The authenticated user.
+
+    Returns:
+        ContactChanges: Changed contacts, deleted IDs and the next token.
+    """
+    service = ContactService(db)
+    return JSONResponse(content=await service.get_changes(user, since, limit))
+
+
+@router.get("/contacts/stream")
+async def contact_events(
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """
+    Push contact changes of the authenticated user as Server-Sent Events.
+
+    Every create, update, import and delete produces an event named
+    after the change, with a JSON body such as
+    `{"type": "updated", "ids": [1]}`. A comment line is sent when
+    nothing happens for a while, so idle connections stay open.
+
+    Args:
+        db (AsyncSession): Database session dependency.
+        user (User): The authenticated user.
+
+    Returns:
+        StreamingResponse: `text/event-stream` response.
+    """
+    service = ContactService(db)
+    events = service.stream_events(user)
+
+    async def body():
+        async for event in events:
+            if event is None:
+                yield ": keep-alive\n\n"
+            else:
+                yield f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/contacts/suggest", response_model=List[ContactSuggestion])
+async def suggest_contacts(
+    prefix: str = Query(..., max_length=101),
+    limit: int = Query(10, ge=1, le=50),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """
+    Suggest contacts while the user types a name.
+
+    Matches the beginning of "name surname", ignoring letter case, and
+    returns only what a picker needs to show.
+
+    Args:
+        prefix (str): Typed beginning of the display name.
+        limit (int, optional): Maximum number of suggestions.
+        db (AsyncSession): Database session dependency.
+        user (User): The authenticated user.
+
+    Returns:
+        List[ContactSuggestion]: IDs and display names.
+    """
+    service = ContactService(db)
+    return JSONResponse(
+        content=await service.suggest_contacts(prefix, limit, user)
+    )
+
+
+@router.get("/contacts/lookup", response_model=List[ContactResponse])
+async def lookup_contacts(
+    request: Request,
+    response: Response,
+    phone: str = Query(None),
+    email: str = Query(None),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """
+    Find the contacts that own a phone number and/or an email address.
+
+    Unlike the filters of the contact list, this is an exact match that
+    ignores phone formatting and email letter case.
+
+    Args:
+        request (Request): Incoming request.
+        response (Response): Outgoing response, used to set the ETag.
+        phone (str, optional): Phone number, e.g. "+380 50 123 45 67".
+        email (str, optional): Email address.
+        db (AsyncSession): Database session dependency.
+        user (User): The authenticated user.
+
+    Returns:
+        List[ContactResponse]: The matching contacts.
+    """
+    service = ContactService(db)
+    return await _conditional_read(
+        request, response, service, user, "lookup",
+        lambda: service.lookup_contacts(user, phone, email),
+    )
+
+
+@router.get("/contacts/batch", response_model=ContactBatch)
+async def read_contacts_batch(
+    ids: str = Query(...),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """
+    Retrieve many contacts by ID with a single request.
+
+    Args:
+        ids (str): Comma-separated contact IDs.
+        db (AsyncSession): Database session dependency.
+        user (User): The authenticated user.
+
+    Returns:
+        ContactBatch: The found contacts and the IDs that were not found.
+    """
+    service = ContactService(db)
+    return JSONResponse(content=await service.get_contacts_batch(ids, user))
 
 
 @router.get("/contacts/{contact_id}", response_model=ContactResponse)
 async def read_contact(
     contact_id: int,
+    request: Request,
+    response: Response,
+    fields: str = Query(None),
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
     """
     Retrieve details of a specific contact by its ID.
 
+    Responds with 304 when `If-None-Match` matches the current ETag.
+
     Args:
         contact_id (int): The ID of the contact to retrieve.
+        request (Request): Incoming request.
+        response (Response): Outgoing response, used to set the ETag.
+        fields (str, optional): Comma-separated fields to return.
         db (AsyncSession): Database session dependency.
         user (User): The authenticated user.
 
@@ -82,22 +574,33 @@ async def read_contact(
         ContactResponse: The contact details.
     """
     service = ContactService(db)
-    return await service.get_contact(contact_id, user)
+    return await _conditional_read(
+        request, response, service, user, "contact",
+        lambda: service.get_contact(contact_id, user, fields),
+    )
 
 
 @router.put("/contacts/{contact_id}", response_model=ContactResponse)
 async def update_contact(
     contact_id: int,
     body: ContactModel,
+    request: Request,
+    idempotency_key: str = Header(
+        None, alias="Idempotency-Key", max_length=255
+    ),
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
     """
     Update an existing contact's details.
 
+    Supports the `Idempotency-Key` header like contact creation.
+
     Args:
         contact_id (int): The ID of the contact to update.
         body (ContactModel): The updated contact data.
+        request (Request): Incoming request.
+        idempotency_key (str, optional): Client-chosen key of the request.
         db (AsyncSession): Database session dependency.
         user (User): The authenticated user.
 
@@ -105,7 +608,44 @@ async def update_contact(
         ContactResponse: The updated contact details.
     """
     service = ContactService(db)
-    return await service.update_contact(contact_id, body, user)
+    return await _idempotent(
+        request, user, idempotency_key, body, status.HTTP_200_OK,
+        lambda: service.update_contact(contact_id, body, user),
+    )
+
+
+@router.patch("/contacts/{contact_id}", response_model=ContactResponse)
+async def patch_contact(
+    contact_id: int,
+    body: ContactUpdate,
+    request: Request,
+    idempotency_key: str = Header(
+        None, alias="Idempotency-Key", max_length=255
+    ),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """
+    Partially update a contact; only the fields sent are changed.
+
+    Supports the `Idempotency-Key` header like contact creation.
+
+    Args:
+        contact_id (int): The ID of the contact to update.
+        body (ContactUpdate): The fields to change.
+        request (Request): Incoming request.
+        idempotency_key (str, optional): Client-chosen key of the request.
+        db (AsyncSession): Database session dependency.
+        user (User): The authenticated user.
+
+    Returns:
+        ContactResponse: The updated contact details.
+    """
+    service = ContactService(db)
+    return await _idempotent(
+        request, user, idempotency_key, body, status.HTTP_200_OK,
+        lambda: service.update_contact(contact_id, body, user, partial=True),
+    )
 
 
 @router.delete("/contacts/{contact_id}", response_model=ContactResponse)
@@ -131,7 +671,10 @@ async def delete_contact(
 
 @router.get("/contacts/birthdays/", response_model=List[ContactResponse])
 async def upcoming_birthdays(
-    days: int = 7,
+    request: Request,
+    response: Response,
+    days: int = Query(7, ge=0),
+    fields: str = Query(None),
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
@@ -139,9 +682,14 @@ async def upcoming_birthdays(
     Retrieve contacts with upcoming birthdays within a specified number
     of days.
 
+    Responds with 304 when `If-None-Match` matches the current ETag.
+
     Args:
+        request (Request): Incoming request.
+        response (Response): Outgoing response, used to set the ETag.
         days (int, optional): Number of days to look ahead for upcoming
         birthdays. Defaults to 7.
+        fields (str, optional): Comma-separated fields to return.
         db (AsyncSession): Database session dependency.
         user (User): The authenticated user.
 
@@ -149,4 +697,8 @@ async def upcoming_birthdays(
         List[ContactResponse]: A list of contacts with upcoming birthdays.
     """
     service = ContactService(db)
-    return await service.get_upcoming_birthdays(days, user)
+    return await _conditional_read(
+        request, response, service, user, "birthdays",
+        lambda: service.get_upcoming_birthdays(days, user, fields),
+        today=date.today(),
+    )
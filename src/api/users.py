@@ -14,18 +14,26 @@ router = APIRouter(prefix="/users", tags=["users"])
 
 
 @router.get("/me", response_model=User)
-async def me(user: User = Depends(get_current_user)):
+async def me(
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
     """
     Retrieve the authenticated user's profile information.
 
+    The full profile is loaded, because the authenticated user may
+    come from a cache or the token and lack fields such as the avatar.
+
     Args:
         user (User): The currently authenticated user.
+        db (AsyncSession): Database session dependency.
 
     Returns:
+        User: The user's profile.
     """
     try:
         logging.info(f"Запит профілю для користувача: {user.username}")
-        return user
+        return await UserService(db).get_user_by_id(user.id)
     except Exception as e:
         logging.error(f"Помилка отримання профілю користувача: {e}")
         raise HTTPException(status_code=500, detail="Internal Server Error")
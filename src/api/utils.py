@@ -3,6 +3,9 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.database import get_db
+from src.database.models import User
+from src.services.auth import get_current_admin_user
+from src.services.redis_cache import cache_stats
 
 router = APIRouter(tags=["utils"])
 
@@ -46,3 +49,19 @@ async def healthchecker(db: AsyncSession = Depends(get_db)):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error connecting to the database",
         )
+
+
+@router.get("/cache/stats")
+async def read_cache_stats(user: User = Depends(get_current_admin_user)):
+    """
+    Report hit and miss counters of the application caches.
+
+    Counters are kept per worker process and reset on restart.
+
+    Args:
+        user (User): The authenticated administrator.
+
+    Returns:
+        dict: Hits, misses and hit ratio for every cache.
+    """
+    return cache_stats.snapshot()
@@ -22,6 +22,23 @@ class Settings(BaseSettings):
     JWT_SECRET: str
     JWT_ALGORITHM: str
     JWT_EXPIRATION_SECONDS: int
+    # Trust the user claims of access tokens instead of loading the user
+    AUTH_STATELESS: bool = False
+    # Seconds a worker reuses a user's token version from Redis, and for
+    # how many users at most
+    AUTH_REVOCATION_CHECK_TTL: int = 30
+    AUTH_REVOCATION_CACHE_SIZE: int = 10000
+    # Verified access tokens each worker remembers until they expire;
+    # set AUTH_TOKEN_CACHE to false to verify every request's token
+    AUTH_TOKEN_CACHE: bool = True
+    AUTH_TOKEN_CACHE_SIZE: int = 10000
+    # TTL in seconds of users cached in Redis; each entry's TTL is
+    # spread by up to this fraction so that entries do not expire together
+    USER_CACHE_TTL: int = 86400
+    USER_CACHE_TTL_JITTER: float = 0.1
+    # Users kept in the memory of each worker, and for how many seconds
+    USER_LOCAL_CACHE_SIZE: int = 10000
+    USER_LOCAL_CACHE_TTL: int = 60
 
     # Email settings
     MAIL_USERNAME: str
@@ -47,6 +64,49 @@ class Settings(BaseSettings):
     REDIS_PORT: int
     REDIS_DB: int
 
+    # Threads hashing passwords, and how many hashing jobs may run or
+    # wait at once before new ones are rejected with 503
+    HASH_POOL_SIZE: int = 4
+    HASH_QUEUE_LIMIT: int = 64
+
+    # Bulk contact creation limits
+    CONTACTS_BULK_MAX_ITEMS: int = 10000
+    CONTACTS_BULK_BATCH_SIZE: int = 1000
+
+    # Rows fetched per round trip when exporting contacts
+    CONTACTS_EXPORT_BATCH_SIZE: int = 500
+
+    # Contact import from CSV / vCard files
+    CONTACTS_IMPORT_CHUNK_SIZE: int = 5000
+    CONTACTS_IMPORT_MAX_ERRORS: int = 1000
+    # Seconds after which the import lock of a crashed worker expires
+    CONTACTS_IMPORT_LOCK_TTL: int = 3600
+
+    # TTL in seconds of cached contact reads, per route
+    CONTACTS_CACHE_TTL_LIST: int = 300
+    CONTACTS_CACHE_TTL_CONTACT: int = 600
+    CONTACTS_CACHE_TTL_BIRTHDAYS: int = 600
+    CONTACTS_CACHE_TTL_LOOKUP: int = 600
+    CONTACTS_CACHE_TTL_COUNT: int = 3600
+
+    # Maximum number of IDs of one batch contact lookup
+    CONTACTS_BATCH_MAX_IDS: int = 100
+
+    # Idempotency-Key handling: how long responses are replayed and how
+    # long a request may hold its key before a retry can take over
+    IDEMPOTENCY_TTL: int = 86400
+    IDEMPOTENCY_LOCK_TTL: int = 30
+
+    # Longest expected contact write transaction in seconds; the changes
+    # feed re-sends changes this recent in case older-stamped rows of a
+    # still running transaction commit after them
+    CONTACTS_CHANGES_MAX_TXN_AGE: int = 600
+
+    # Seconds between keep-alive comments of the contacts event stream
+    CONTACTS_STREAM_HEARTBEAT: int = 15
+    # Events a stream client may fall behind before it is disconnected
+    CONTACTS_STREAM_QUEUE_SIZE: int = 100
+
     @property
     def database_url(self) -> str:
         """
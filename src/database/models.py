@@ -5,9 +5,11 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     func,
+    literal_column,
     Enum as SqlEnum,
 )
 from sqlalchemy.ext.declarative import declarative_base
@@ -36,9 +38,15 @@ class Contact(Base):
         id (int): Primary key for the contact.
         name (str): First name of the contact.
         surname (str): Last name of the contact.
-        email (str): Unique email address of the contact.
-        phone (str): Unique phone number of the contact.
+        email (str): Email address of the contact, unique per owner.
+        phone (str): Phone number of the contact, unique per owner.
         birthday (date): Birthday of the contact.
+        birthday_key (int): Birthday as an MMDD number, used to look up
+        upcoming birthdays by index.
+        phone_digits (str): Digits of the phone number without any
+        formatting, used for exact lookups.
+        email_lower (str): Lowercased email address, used for exact
+        lookups.
         created_at (datetime): Timestamp of when the contact was created.
         updated_at (datetime): Timestamp of the last update.
         info (str, optional): Additional information about the contact.
@@ -52,9 +60,12 @@ class Contact(Base):
     id = Column(Integer, primary_key=True)
     name = Column(String(50), nullable=False)
     surname = Column(String(50), nullable=False)
-    email = Column(String(100), nullable=False, unique=True)
-    phone = Column(String(20), nullable=False, unique=True)
+    email = Column(String(100), nullable=False)
+    phone = Column(String(20), nullable=False)
     birthday = Column(Date, nullable=False)
+    birthday_key = Column(Integer, nullable=False)
+    phone_digits = Column(String(16), nullable=False)
+    email_lower = Column(String(100), nullable=False)
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
     info = Column(String(500), nullable=True)
@@ -65,6 +76,90 @@ class Contact(Base):
     )
     user = relationship("User", backref="contacts")
 
+    __table_args__ = (
+        # Serves keyset pagination: WHERE user_id = ? AND id > ? ORDER BY id
+        Index("ix_contacts_user_id_id", "user_id", "id"),
+        # Same for the other sort orders of the contact list:
+        # WHERE user_id = ? AND (key, id) > (?, ?) ORDER BY key, id
+        Index("ix_contacts_user_id_name_id", "user_id", "name", "id"),
+        Index("ix_contacts_user_id_surname_id", "user_id", "surname", "id"),
+        Index("ix_contacts_user_id_birthday_id", "user_id", "birthday", "id"),
+        Index(
+            "ix_contacts_user_id_created_at_id",
+            "user_id", "created_at", "id",
+        ),
+        # Duplicate contacts are detected per owner by ON CONFLICT
+        Index("ix_contacts_user_id_email", "user_id", "email", unique=True),
+        Index("ix_contacts_user_id_phone", "user_id", "phone", unique=True),
+        Index("ix_contacts_user_id_birthday_key", "user_id", "birthday_key"),
+        # Exact reverse lookups by normalized phone and email
+        Index("ix_contacts_user_id_phone_digits", "user_id", "phone_digits"),
+        Index("ix_contacts_user_id_email_lower", "user_id", "email_lower"),
+        # Prefix search on the display name:
+        # WHERE user_id = ? AND lower(name || ' ' || surname) ~>=~ ?
+        # ORDER BY lower(name || ' ' || surname) USING ~<~, id
+        Index(
+            "ix_contacts_user_id_display_name_id",
+            user_id,
+            func.lower(
+                name + literal_column("' '") + surname
+            ).label("display_name"),
+            id,
+            postgresql_ops={"display_name": "text_pattern_ops"},
+        ),
+        # Serves the changes feed: WHERE user_id = ?
+        # AND (updated_at, id) > (?, ?) ORDER BY updated_at, id
+        Index(
+            "ix_contacts_user_id_updated_at_id",
+            "user_id", "updated_at", "id",
+        ),
+        # Trigram indexes let PostgreSQL serve '%term%' searches
+        Index(
+            "ix_contacts_name_trgm", "name",
+            postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_contacts_surname_trgm", "surname",
+            postgresql_using="gin",
+            postgresql_ops={"surname": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_contacts_email_trgm", "email",
+            postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+    )
+
+
+class DeletedContact(Base):
+    """
+    ORM model of a tombstone left behind by a deleted contact.
+
+    Contacts are deleted for real; tombstones let clients that sync
+    incrementally learn about the deletions.
+
+    Attributes:
+        id (int): Primary key of the tombstone.
+        contact_id (int): ID the deleted contact had.
+        user_id (int): Foreign key referencing the owner of the contact.
+        deleted_at (datetime): Timestamp of the deletion.
+    """
+
+    __tablename__ = "deleted_contacts"
+
+    id = Column(Integer, primary_key=True)
+    contact_id = Column(Integer, nullable=False)
+    user_id = Column(
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    deleted_at = Column(DateTime, default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index(
+            "ix_deleted_contacts_user_id_deleted_at_id",
+            "user_id", "deleted_at", "id",
+        ),
+    )
+
 
 class User(Base):
     """
@@ -1,14 +1,118 @@
-from datetime import datetime, timedelta
-from typing import List
+import json
+import re
+from datetime import date, datetime, timedelta
+from typing import AsyncIterator, List
 
-from sqlalchemy import select, and_, or_
+from sqlalchemy import (
+    DateTime,
+    and_,
+    case,
+    cast,
+    column,
+    delete,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    table,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.expression import UnaryExpression
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.sql import extract
 
-from src.database.models import Contact, User
+from src.database.models import Contact, DeletedContact, User
+from src.conf.config import settings
 from src.schemas.contacts import ContactModel
 
 
+# Temporary table that contact imports are copied into before merging
+STAGING_TABLE = table(
+    "contacts_import",
+    column("name"),
+    column("surname"),
+    column("email"),
+    column("phone"),
+    column("birthday"),
+    column("birthday_key"),
+    column("phone_digits"),
+    column("email_lower"),
+    column("info"),
+)
+
+# Everything but digits is formatting: spaces, dashes, brackets, "+"
+NON_DIGITS = re.compile(r"\D")
+
+
+def birthday_key(value: date) -> int:
+    """
+    Convert a date into the MMDD number stored in `Contact.birthday_key`.
+
+    Args:
+        value (date): Birthday or calendar date.
+
+    Returns:
+        int: Month and day packed as `month * 100 + day`.
+    """
+    return value.month * 100 + value.day
+
+
+def normalize_phone(value: str) -> str:
+    """
+    Reduce a phone number to the digits stored in `Contact.phone_digits`.
+
+    No country code is added, so a national number such as "0501234567"
+    and its international form "+380501234567" stay different values.
+
+    Args:
+        value (str): Phone number as typed, e.g. "+380 (50) 123-45-67".
+
+    Returns:
+        str: The digits of the number.
+    """
+    return NON_DIGITS.sub("", value)
+
+
+def normalize_email(value: str) -> str:
+    """
+    Convert an email address into the form stored in
+    `Contact.email_lower`.
+
+    Args:
+        value (str): Email address.
+
+    Returns:
+        str: Lowercased address without surrounding whitespace.
+    """
+    return value.strip().lower()
+
+
+def derived_columns(values: dict) -> dict:
+    """
+    Compute the columns derived from the contact fields in `values`.
+
+    Args:
+        values (dict): Contact column values, possibly partial.
+
+    Returns:
+        dict: Values of `birthday_key`, `phone_digits` and `email_lower`
+        for the source fields present in `values`.
+    """
+    derived = {}
+    if values.get("birthday") is not None:
+        derived["birthday_key"] = birthday_key(values["birthday"])
+    if values.get("phone") is not None:
+        derived["phone_digits"] = normalize_phone(values["phone"])
+    if values.get("email") is not None:
+        derived["email_lower"] = normalize_email(values["email"])
+    return derived
+
+
 class ContactRepository:
     """
     Repository for managing contact-related database operations.
@@ -22,47 +126,344 @@ class ContactRepository:
         """
         self.db = db
 
-    async def is_contact_exists(self, email: str, phone: str) -> bool:
+    def _is_postgresql(self) -> bool:
         """
-       Check if a contact with the given email or phone exists.
+        Check whether the session is bound to a PostgreSQL database.
 
-       Args:
-           email (str): Contact's email.
-           phone (str): Contact's phone number.
+        Returns:
+            bool: True for PostgreSQL, False for any other dialect.
+        """
+        return self.db.get_bind().dialect.name == "postgresql"
 
-       Returns:
-           bool: True if contact exists, False otherwise.
+    @staticmethod
+    def _select(fields: List[str] | None = None):
         """
-        result = await self.db.execute(
-            select(Contact).filter(
-                or_(Contact.email == email, Contact.phone == phone))
-        )
-        return result.scalar_one_or_none() is not None
+        Start a SELECT of whole contacts or of the requested columns only.
+
+        Args:
+            fields (List[str], optional): Column names to load. When
+            omitted, ORM `Contact` entities are loaded.
+
+        Returns:
+            Select: Statement selecting contacts.
+        """
+        if fields is None:
+            return select(Contact)
+        return select(*(Contact.__table__.c[field] for field in fields))
 
-    async def create_contact(self, body: ContactModel, user: User) -> Contact:
+    @staticmethod
+    def _rows(result, fields: List[str] | None = None) -> list:
+        """
+        Extract the rows of a result produced by `_select`.
+
+        Args:
+            result: Executed statement result.
+            fields (List[str], optional): Column names that were selected.
+
+        Returns:
+            list: `Contact` entities, or row mappings for a projection.
+        """
+        if fields is None:
+            return result.scalars().all()
+        return result.mappings().all()
+
+    def _insert(self, target=Contact.__table__):
+        """
+        Build an INSERT for the contacts table that supports ON CONFLICT.
+
+        Args:
+            target: `Contact` to return ORM objects, or the contacts
+            table (default) for plain rows.
+
+        Returns:
+            Insert: Dialect-specific insert statement.
+        """
+        dialect = postgresql if self._is_postgresql() else sqlite
+        return dialect.insert(target)
+
+    async def create_contact(
+        self, body: ContactModel, user: User
+    ) -> Contact | None:
         """
         Create a new contact for the authenticated user.
 
+        Uses a single `INSERT ... ON CONFLICT DO NOTHING RETURNING`, so
+        concurrent requests cannot both create the same contact.
+
         Args:
             body (ContactModel): Contact data.
             user (User): Authenticated user.
 
         Returns:
-            Contact: The created contact instance.
+            Contact | None: The created contact instance, or None if the
+            user already has a contact with this email or phone.
         """
-        db_contact = Contact(**body.model_dump(), user_id=user.id)
-        self.db.add(db_contact)
+        stmt = (
+            self._insert(Contact)
+            .values(self._contact_rows([body], user))
+            .on_conflict_do_nothing()
+            .returning(Contact)
+        )
+        result = await self.db.execute(stmt)
+        db_contact = result.scalar_one_or_none()
         await self.db.commit()
-        await self.db.refresh(db_contact)
         return db_contact
 
+    def _contact_rows(
+        self, bodies: List[ContactModel], user: User
+    ) -> List[dict]:
+        """
+        Build column values for inserting contacts with Core statements.
+
+        Args:
+            bodies (List[ContactModel]): Validated contact data.
+            user (User): Owner of the contacts.
+
+        Returns:
+            List[dict]: One dictionary of column values per contact.
+        """
+        rows = []
+        for body in bodies:
+            values = body.model_dump()
+            rows.append(
+                {**values, **derived_columns(values), "user_id": user.id}
+            )
+        return rows
+
+    async def _insert_contacts(
+        self, bodies: List[ContactModel], user: User
+    ) -> List[tuple[int, str, str]]:
+        """
+        Insert contacts in batches without committing, skipping conflicts.
+
+        Args:
+            bodies (List[ContactModel]): Validated contact data.
+            user (User): Owner of the contacts.
+
+        Returns:
+            List[tuple[int, str, str]]: ID, email and phone of every
+            inserted contact.
+        """
+        created = []
+        batch_size = settings.CONTACTS_BULK_BATCH_SIZE
+        for start in range(0, len(bodies), batch_size):
+            stmt = (
+                self._insert()
+                .values(self._contact_rows(
+                    bodies[start:start + batch_size], user
+                ))
+                .on_conflict_do_nothing()
+                .returning(
+                    Contact.__table__.c.id,
+                    Contact.__table__.c.email,
+                    Contact.__table__.c.phone,
+                )
+            )
+            result = await self.db.execute(stmt)
+            created.extend(tuple(row) for row in result.all())
+        return created
+
+    async def create_contacts(
+        self, bodies: List[ContactModel], user: User
+    ) -> List[tuple[int, str, str]]:
+        """
+        Insert many contacts, skipping the ones that already exist.
+
+        Rows are sent in batches of `CONTACTS_BULK_BATCH_SIZE`, one
+        multi-row `INSERT ... ON CONFLICT DO NOTHING RETURNING` per batch,
+        and committed together.
+
+        Args:
+            bodies (List[ContactModel]): Validated contact data.
+            user (User): Authenticated user.
+
+        Returns:
+            List[tuple[int, str, str]]: ID, email and phone of every
+            inserted contact.
+        """
+        created = await self._insert_contacts(bodies, user)
+        await self.db.commit()
+        return created
+
+    async def import_contacts(
+        self, chunks: AsyncIterator[List[ContactModel]], user: User
+    ) -> int:
+        """
+        Load chunks of contacts and merge them into the contacts table.
+
+        On PostgreSQL every chunk is copied with `COPY` into a temporary
+        staging table, which is then merged by a single
+        `INSERT ... SELECT ... ON CONFLICT DO NOTHING`. Other databases
+        fall back to batched multi-row inserts. Everything is committed
+        in one transaction.
+
+        Args:
+            chunks (AsyncIterator[List[ContactModel]]): Validated contacts.
+            user (User): Owner of the imported contacts.
+
+        Returns:
+            int: Number of contacts that were created.
+        """
+        if not self._is_postgresql():
+            created = 0
+            async for bodies in chunks:
+                created += len(await self._insert_contacts(bodies, user))
+            await self.db.commit()
+            return created
+
+        connection = await self.db.connection()
+        await connection.execute(text(
+            f"CREATE TEMP TABLE {STAGING_TABLE.name} ("
+            "name varchar(50), surname varchar(50), email varchar(100), "
+            "phone varchar(20), birthday date, birthday_key integer, "
+            "phone_digits varchar(16), email_lower varchar(100), "
+            "info varchar(500)) ON COMMIT DROP"
+        ))
+        raw_connection = await connection.get_raw_connection()
+        columns = [column.name for column in STAGING_TABLE.columns]
+        async for bodies in chunks:
+            await raw_connection.driver_connection.copy_records_to_table(
+                STAGING_TABLE.name,
+                records=[
+                    tuple(row[column] for column in columns)
+                    for row in self._contact_rows(bodies, user)
+                ],
+                columns=columns,
+            )
+
+        contacts = Contact.__table__
+        merge = (
+            postgresql.insert(contacts)
+            .from_select(
+                [*columns, "user_id"],
+                select(*STAGING_TABLE.columns, literal(user.id)),
+            )
+            .on_conflict_do_nothing()
+        )
+        result = await connection.execute(merge)
+        await self.db.commit()
+        return result.rowcount
+
+    @staticmethod
+    def _filter(
+        query, user: User, name: str | None = None,
+        surname: str | None = None, email: str | None = None,
+        q: str | None = None,
+    ):
+        """
+        Restrict a contacts query to the user and the list filters.
+
+        Args:
+            query (Select): Statement selecting from the contacts table.
+            user (User): Authenticated user.
+            name (str, optional): Substring of the name.
+            surname (str, optional): Substring of the surname.
+            email (str, optional): Substring of the email.
+            q (str, optional): Substring of the name, surname or email,
+            in any letter case.
+
+        Returns:
+            Select: The filtered statement.
+        """
+        query = query.filter(Contact.user_id == user.id)
+        if name:
+            query = query.filter(Contact.name.contains(name))
+        if surname:
+            query = query.filter(Contact.surname.contains(surname))
+        if email:
+            query = query.filter(Contact.email.contains(email))
+        if q:
+            # One bound pattern keeps the predicate indexable by pg_trgm
+            pattern = "%{}%".format(
+                q.replace("/", "//").replace("%", "/%").replace("_", "/_")
+            )
+            query = query.filter(
+                or_(
+                    Contact.name.ilike(pattern, escape="/"),
+                    Contact.surname.ilike(pattern, escape="/"),
+                    Contact.email.ilike(pattern, escape="/"),
+                )
+            )
+        return query
+
+    async def count_contacts(
+        self, user: User, name: str | None = None,
+        surname: str | None = None, email: str | None = None,
+        q: str | None = None,
+    ) -> int:
+        """
+        Count the contacts matching the list filters exactly.
+
+        Args:
+            user (User): Authenticated user.
+            name (str, optional): Filter by name.
+            surname (str, optional): Filter by surname.
+            email (str, optional): Filter by email.
+            q (str, optional): Search term for name, surname and email.
+
+        Returns:
+            int: Number of matching contacts.
+        """
+        query = self._filter(
+            select(func.count()).select_from(Contact),
+            user, name, surname, email, q,
+        )
+        result = await self.db.execute(query)
+        return result.scalar_one()
+
+    async def estimate_contacts(
+        self, user: User, name: str | None = None,
+        surname: str | None = None, email: str | None = None,
+        q: str | None = None,
+    ) -> int | None:
+        """
+        Estimate the number of contacts matching the list filters.
+
+        Asks the PostgreSQL planner with `EXPLAIN` instead of counting,
+        so the cost does not grow with the number of matches.
+
+        Args:
+            user (User): Authenticated user.
+            name (str, optional): Filter by name.
+            surname (str, optional): Filter by surname.
+            email (str, optional): Filter by email.
+            q (str, optional): Search term for name, surname and email.
+
+        Returns:
+            int | None: Estimated number of matching contacts, or None
+            if the database cannot estimate it.
+        """
+        if not self._is_postgresql():
+            return None
+        connection = await self.db.connection()
+        compiled = self._filter(
+            select(Contact.id), user, name, surname, email, q
+        ).compile(dialect=connection.dialect)
+        result = await connection.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {compiled}",
+            tuple(compiled.params[key] for key in compiled.positiontup),
+        )
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
     async def get_contacts(
         self, name: str, surname: str, email: str,
-        skip: int, limit: int, user: User
+        skip: int, limit: int, user: User, after: tuple | None = None,
+        q: str | None = None, fields: List[str] | None = None,
+        sort: str = "id", descending: bool = False,
     ) -> List[Contact]:
         """
        Retrieve contacts for the authenticated user with optional filters.
 
+       Contacts are ordered by `sort` and then by ID, which a
+       `(user_id, <sort>, id)` index serves in either direction. When
+       `after` is given, keyset pagination is used instead of `skip`, so
+       the cost of a page does not depend on how deep it is. When `q` is
+       given, contacts whose name, surname or email contain it are
+       returned, most relevant first on PostgreSQL.
+
        Args:
            name (str): Filter by name (optional).
            surname (str): Filter by surname (optional).
@@ -70,132 +471,413 @@ class ContactRepository:
            skip (int): Number of records to skip.
            limit (int): Maximum number of records to return.
            user (User): Authenticated user.
+           after (tuple, optional): Sort key and ID of the last contact
+           of the previous page; just the ID when sorting by ID.
+           q (str, optional): Search term matched against name, surname
+           and email.
+           fields (List[str], optional): Only load these columns.
+           sort (str, optional): Column to order by. Defaults to "id".
+           descending (bool, optional): Reverse the order.
 
        Returns:
-           List[Contact]: List of contacts matching the filters.
+           List[Contact]: List of contacts matching the filters, or row
+           mappings when `fields` is given.
        """
-        query = select(Contact).filter_by(user=user)
-        if name:
-            query = query.filter(Contact.name.contains(name))
-        if surname:
-            query = query.filter(Contact.surname.contains(surname))
-        if email:
-            query = query.filter(Contact.email.contains(email))
+        query = self._filter(
+            self._select(fields), user, name, surname, email, q
+        )
+        if q:
+            if self._is_postgresql():
+                # Rank by pg_trgm similarity, served by the trigram indexes
+                query = query.order_by(
+                    func.greatest(
+                        func.similarity(Contact.name, q),
+                        func.similarity(Contact.surname, q),
+                        func.similarity(Contact.email, q),
+                    ).desc()
+                )
+
+        keys = [Contact.id]
+        if sort != "id":
+            keys.insert(0, getattr(Contact, sort))
+        query = query.order_by(
+            *(key.desc() if descending else key for key in keys)
+        )
+        if after is not None:
+            position = tuple_(*keys) if len(keys) > 1 else keys[0]
+            value = after if len(keys) > 1 else after[0]
+            query = query.filter(
+                position < value if descending else position > value
+            )
+        else:
+            query = query.offset(skip)
 
-        result = await self.db.execute(query.offset(skip).limit(limit))
-        return result.scalars().all()
+        result = await self.db.execute(query.limit(limit))
+        return self._rows(result, fields)
 
-    async def get_contact_by_id(self, contact_id: int, user: User) -> Contact:
+    async def stream_contacts(self, user: User) -> AsyncIterator[Contact]:
+        """
+        Stream all contacts of the authenticated user from a server-side
+        cursor, fetching `CONTACTS_EXPORT_BATCH_SIZE` rows at a time.
+
+        Args:
+            user (User): Authenticated user.
+
+        Yields:
+            Contact: Contacts ordered by ID.
+        """
+        query = (
+            select(Contact)
+            .filter(Contact.user_id == user.id)
+            .order_by(Contact.id)
+            .execution_options(yield_per=settings.CONTACTS_EXPORT_BATCH_SIZE)
+        )
+        result = await self.db.stream_scalars(query)
+        async for contact in result:
+            yield contact
+
+    async def get_contact_by_id(
+        self, contact_id: int, user: User, fields: List[str] | None = None
+    ) -> Contact:
         """
         Retrieve a specific contact by ID for the authenticated user.
 
         Args:
             contact_id (int): Contact ID.
             user (User): Authenticated user.
+            fields (List[str], optional): Only load these columns.
 
         Returns:
-            Contact: The contact instance if found, otherwise None.
+            Contact: The contact instance (or row mapping when `fields`
+            is given) if found, otherwise None.
         """
         result = await self.db.execute(
-            select(Contact).filter(
+            self._select(fields).filter(
                 Contact.id == contact_id, Contact.user_id == user.id
             )
         )
-        return result.scalar_one_or_none()
+        if fields is None:
+            return result.scalar_one_or_none()
+        return result.mappings().one_or_none()
+
+    async def lookup_contacts(
+        self, user: User, phone: str | None = None, email: str | None = None,
+        fields: List[str] | None = None,
+    ) -> List[Contact]:
+        """
+        Find contacts by exact phone number and/or email address.
+
+        Both values are normalized the same way as on write and matched
+        against the `(user_id, phone_digits)` and `(user_id, email_lower)`
+        indexes, so formatting and letter case do not matter.
+
+        Args:
+            user (User): Authenticated user.
+            phone (str, optional): Phone number in any formatting.
+            email (str, optional): Email address in any letter case.
+            fields (List[str], optional): Only load these columns.
+
+        Returns:
+            List[Contact]: Matching contacts ordered by ID; row mappings
+            when `fields` is given.
+        """
+        query = self._select(fields).filter(Contact.user_id == user.id)
+        if phone:
+            query = query.filter(Contact.phone_digits == normalize_phone(phone))
+        if email:
+            query = query.filter(Contact.email_lower == normalize_email(email))
+        result = await self.db.execute(query.order_by(Contact.id))
+        return self._rows(result, fields)
+
+    async def suggest_contacts(
+        self, prefix: str, limit: int, user: User
+    ) -> list:
+        """
+        Find contacts whose "name surname" starts with a prefix.
+
+        The prefix is turned into a range on `lower(name || ' ' ||
+        surname)`, which the `(user_id, display name, id)` expression
+        index serves on PostgreSQL together with the ordering, ties
+        included, so only `limit` index entries are read however large
+        the address book is.
+
+        Args:
+            prefix (str): Beginning of the display name, any letter case.
+            limit (int): Maximum number of suggestions.
+            user (User): Authenticated user.
+
+        Returns:
+            list: Row mappings with `id` and `display_name`, ordered by
+            display name.
+        """
+        # The space must be inlined to match the indexed expression
+        display_name = Contact.name + literal_column("' '") + Contact.surname
+        key = func.lower(display_name)
+        start = prefix.lower()
+        # The smallest string greater than all strings with this prefix
+        end = start[:-1] + chr(ord(start[-1]) + 1)
+
+        query = select(
+            Contact.id, display_name.label("display_name")
+        ).filter(Contact.user_id == user.id)
+        if self._is_postgresql():
+            # Operators of text_pattern_ops compare byte-wise, so the
+            # range and the order do not depend on the collation
+            query = query.filter(
+                and_(key.op("~>=~")(start), key.op("~<~")(end))
+            ).order_by(
+                UnaryExpression(key, modifier=operators.custom_op("USING ~<~"))
+            )
+        else:
+            query = query.filter(key >= start, key < end).order_by(key)
+
+        result = await self.db.execute(query.order_by(Contact.id).limit(limit))
+        return result.mappings().all()
+
+    async def get_contacts_by_ids(
+        self, contact_ids: List[int], user: User,
+        fields: List[str] | None = None,
+    ) -> List[Contact]:
+        """
+        Retrieve many contacts of the authenticated user in one query.
+
+        Args:
+            contact_ids (List[int]): IDs of the contacts.
+            user (User): Authenticated user.
+            fields (List[str], optional): Only load these columns.
+
+        Returns:
+            List[Contact]: The contacts that exist and belong to the user,
+            in no particular order; row mappings when `fields` is given.
+        """
+        result = await self.db.execute(
+            self._select(fields).filter(
+                Contact.id.in_(contact_ids), Contact.user_id == user.id
+            )
+        )
+        return self._rows(result, fields)
 
     async def update_contact(
-        self, contact_id: int, body: ContactModel, user: User
-    ) -> Contact:
+        self, contact_id: int, body: ContactModel, user: User,
+        partial: bool = False,
+    ) -> Contact | None:
         """
         Update an existing contact's information.
 
+        Runs a single `UPDATE ... RETURNING` scoped to the owner.
+
         Args:
             contact_id (int): Contact ID.
             body (ContactModel): Updated contact data.
             user (User): Authenticated user.
+            partial (bool, optional): Only update the fields that were
+            set in `body`.
 
         Returns:
-            Contact: The updated contact instance.
+            Contact | None: The updated contact instance, or None if the
+            contact was not found.
+
+        Raises:
+            IntegrityError: If the user already has another contact with
+            the new email or phone.
         """
+        values = body.model_dump(exclude_unset=partial)
+        if not values:
+            return await self.get_contact_by_id(contact_id, user)
+        values.update(derived_columns(values))
 
-        db_contact = await self.get_contact_by_id(contact_id, user)
-        if db_contact:
-            for key, value in body.model_dump().items():
-                setattr(db_contact, key, value)
+        stmt = (
+            update(Contact)
+            .where(Contact.id == contact_id, Contact.user_id == user.id)
+            .values(**values)
+            .returning(Contact)
+        )
+        try:
+            result = await self.db.execute(stmt)
+            db_contact = result.scalar_one_or_none()
             await self.db.commit()
-            await self.db.refresh(db_contact)
+        except IntegrityError:
+            await self.db.rollback()
+            raise
         return db_contact
 
-    async def remove_contact(self, contact_id: int, user: User) -> Contact:
+    async def remove_contact(
+        self, contact_id: int, user: User
+    ) -> Contact | None:
         """
        Delete a contact for the authenticated user.
 
+       Runs a single `DELETE ... RETURNING` scoped to the owner and
+       leaves a `DeletedContact` tombstone for the changes feed, in the
+       same transaction.
+
        Args:
            contact_id (int): Contact ID.
            user (User): Authenticated user.
 
        Returns:
-           Contact: The deleted contact instance.
+           Contact | None: The deleted contact instance, or None if the
+           contact was not found.
        """
-        db_contact = await self.get_contact_by_id(contact_id, user)
-        if db_contact:
-            await self.db.delete(db_contact)
-            await self.db.commit()
+        stmt = (
+            delete(Contact)
+            .where(Contact.id == contact_id, Contact.user_id == user.id)
+            .returning(Contact)
+        )
+        result = await self.db.execute(stmt)
+        db_contact = result.scalar_one_or_none()
+        if db_contact is not None:
+            self.db.add(DeletedContact(contact_id=contact_id, user_id=user.id))
+        await self.db.commit()
         return db_contact
 
+    async def get_changed_contacts(
+        self, user: User, after: tuple | None, limit: int,
+        fields: List[str] | None = None,
+    ) -> List[Contact]:
+        """
+        Retrieve contacts created or updated after a changes feed position.
+
+        Keyset pagination on `(updated_at, id)`, served by the
+        `(user_id, updated_at, id)` index, so the cost depends on the
+        number of changes rather than on the size of the address book.
+
+        Args:
+            user (User): Authenticated user.
+            after (tuple, optional): `(updated_at, id)` of the last contact
+            the client has seen; None to start from the beginning.
+            limit (int): Maximum number of contacts to return.
+            fields (List[str], optional): Only load these columns.
+
+        Returns:
+            List[Contact]: Changed contacts, oldest change first; row
+            mappings when `fields` is given.
+        """
+        query = self._select(fields).filter(Contact.user_id == user.id)
+        if after is not None:
+            query = query.filter(
+                tuple_(Contact.updated_at, Contact.id) > after
+            )
+        query = query.order_by(Contact.updated_at, Contact.id).limit(limit)
+        result = await self.db.execute(query)
+        return self._rows(result, fields)
+
+    async def get_feed_horizon(self, max_age: int) -> datetime:
+        """
+        Return the oldest change time that may still be uncommitted.
+
+        `updated_at` and `deleted_at` are stamped with the start time of
+        the writing transaction, so a transaction running for a while
+        commits rows older than changes other clients have already seen.
+        Feed positions are held back to this horizon.
+
+        Args:
+            max_age (int): Longest expected write transaction, in seconds.
+
+        Returns:
+            datetime: Current database time minus `max_age`, in the same
+            form as the stored timestamps.
+        """
+        now = func.now()
+        if self._is_postgresql():
+            # The timestamp columns are stored without a time zone
+            now = cast(now, DateTime)
+        result = await self.db.execute(select(now))
+        return result.scalar_one() - timedelta(seconds=max_age)
+
+    async def get_tombstones(
+        self, user: User, after: tuple | None, limit: int
+    ) -> list:
+        """
+        Retrieve tombstones of contacts deleted after a feed position.
+
+        Args:
+            user (User): Authenticated user.
+            after (tuple, optional): `(deleted_at, id)` of the last
+            tombstone the client has seen; None for all tombstones.
+            limit (int): Maximum number of tombstones to return.
+
+        Returns:
+            list: Row mappings with `id`, `contact_id` and `deleted_at`,
+            oldest first.
+        """
+        query = select(
+            DeletedContact.id, DeletedContact.contact_id,
+            DeletedContact.deleted_at,
+        ).filter(DeletedContact.user_id == user.id)
+        if after is not None:
+            query = query.filter(
+                tuple_(DeletedContact.deleted_at, DeletedContact.id) > after
+            )
+        query = query.order_by(
+            DeletedContact.deleted_at, DeletedContact.id
+        ).limit(limit)
+        result = await self.db.execute(query)
+        return result.mappings().all()
+
+    async def get_last_tombstone(self, user: User):
+        """
+        Retrieve the newest tombstone of the user.
+
+        Args:
+            user (User): Authenticated user.
+
+        Returns:
+            Row mapping with `id` and `deleted_at`, or None if the user
+            has never deleted a contact.
+        """
+        result = await self.db.execute(
+            select(DeletedContact.id, DeletedContact.deleted_at)
+            .filter(DeletedContact.user_id == user.id)
+            .order_by(
+                DeletedContact.deleted_at.desc(), DeletedContact.id.desc()
+            )
+            .limit(1)
+        )
+        return result.mappings().one_or_none()
+
     async def get_upcoming_birthdays(
-            self, days: int, user: User
+            self, days: int, user: User, fields: List[str] | None = None
     ) -> List[Contact]:
         """
        Get a list of contacts whose birthdays are within the next `days` days.
 
+       The lookup is a range scan on `(user_id, birthday_key)`; a window
+       that wraps past the end of the year is split into two ranges.
+
        Args:
            days (int): Number of upcoming days to check.
            user (User): Authenticated user.
+           fields (List[str], optional): Only load these columns.
 
        Returns:
-           List[Contact]: List of contacts with upcoming birthdays.
+           List[Contact]: List of contacts with upcoming birthdays,
+           nearest first; row mappings when `fields` is given.
        """
-        today = datetime.today().date()
+        today = date.today()
+        start_key = birthday_key(today)
         end_date = today + timedelta(days=days)
+        end_key = birthday_key(end_date)
 
-        # Get the day and month of the current date and the end date
-        today_day = today.day
-        today_month = today.month
-        end_day = end_date.day
-        end_month = end_date.month
+        query = self._select(fields).filter(Contact.user_id == user.id)
+        if days < 365:
+            if end_date.year == today.year:
+                query = query.filter(
+                    Contact.birthday_key.between(start_key, end_key)
+                )
+            else:
+                query = query.filter(
+                    or_(
+                        Contact.birthday_key >= start_key,
+                        Contact.birthday_key <= end_key,
+                    )
+                )
 
-        query = (
-            select(Contact)
-            .filter(
-                Contact.user_id == user.id,
-                or_(
-                    # Birthdays in the current month within range
-                    and_(
-                        extract("month", Contact.birthday) == today_month,
-                        extract("day", Contact.birthday) >= today_day,
-                    ),
-                    # Birthdays in the next month within range
-                    and_(
-                        extract("month", Contact.birthday) == end_month,
-                        extract("day", Contact.birthday) <= end_day,
-                    ),
-                    # Birthdays that cross the month
-                    and_(
-                        extract("month", Contact.birthday) == today_month,
-                        extract("day", Contact.birthday) >= today_day,
-                    ),
-                    and_(
-                        extract("month", Contact.birthday) == end_month,
-                        extract("day", Contact.birthday) <= end_day,
-                    ),
-                ),
-            )
-            .order_by(
-                extract("month", Contact.birthday),
-                extract("day", Contact.birthday),
-            )
+        # Birthdays later this year come before those after New Year
+        query = query.order_by(
+            case((Contact.birthday_key >= start_key, 0), else_=1),
+            Contact.birthday_key,
         )
 
         result = await self.db.execute(query)
-        return result.scalars().all()
+        return self._rows(result, fields)
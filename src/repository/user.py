@@ -81,16 +81,20 @@ class UserRepository:
         await self.db.refresh(user)
         return user
 
-    async def confirmed_email(self, email: str) -> None:
+    async def confirmed_email(self, email: str) -> User:
         """
         Mark a user's email as verified.
 
         Args:
             email (str): The email address of the user.
+
+        Returns:
+            User: The verified user instance.
         """
         user = await self.get_user_by_email(email)
         user.is_verified = True
         await self.db.commit()
+        return user
 
     async def update_avatar_url(self, email: str, url: str) -> User:
         """
@@ -1,8 +1,9 @@
 import re
 from datetime import date, datetime
-from typing import Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field, ConfigDict, EmailStr, validator
+from typing_extensions import TypedDict
 
 
 class ContactModel(BaseModel):
@@ -64,6 +65,23 @@ class ContactModel(BaseModel):
         return value
 
 
+class ContactUpdate(ContactModel):
+    """
+    Schema for partially updating a contact.
+
+    Only the fields present in the request are changed.
+    """
+    name: str = Field(None, min_length=2, max_length=50, example="John")
+    surname: str = Field(None, min_length=2, max_length=50, example="Doe")
+    email: EmailStr = Field(
+        None, min_length=7, max_length=100, example="john.doe@example.com"
+    )
+    phone: str = Field(
+        None, min_length=7, max_length=20, example="+380501234567"
+    )
+    birthday: date = Field(None, example="1990-01-01")
+
+
 class ContactResponse(ContactModel):
     """
     Schema for returning contact data with additional metadata.
@@ -72,3 +90,94 @@ class ContactResponse(ContactModel):
     created_at: datetime
     updated_at: Optional[datetime]
     model_config = ConfigDict(from_attributes=True)  # Enable ORM mode
+
+
+class ContactRow(TypedDict, total=False):
+    """
+    Contact row read from the database, serialized without validation.
+
+    Keys are optional, so the same type describes sparse fieldsets.
+    """
+    id: int
+    name: str
+    surname: str
+    email: str
+    phone: str
+    birthday: date
+    info: Optional[str]
+    created_at: datetime
+    updated_at: Optional[datetime]
+
+
+class ContactChanges(BaseModel):
+    """
+    Schema for one page of the contacts changes feed.
+    """
+    changes: List[ContactResponse]
+    deleted: List[int]
+    next: str
+    has_more: bool
+
+
+class ContactSuggestion(BaseModel):
+    """
+    Schema for one contact suggested while typing a name.
+    """
+    id: int
+    display_name: str
+
+
+class ContactBatch(BaseModel):
+    """
+    Schema for the result of a batch contact lookup.
+    """
+    contacts: List[ContactResponse]
+    missing: List[int]
+
+
+class BulkContactResult(BaseModel):
+    """
+    Outcome of a single item of a bulk contact creation request.
+    """
+    index: int
+    status: Literal["created", "duplicate", "invalid"]
+    id: Optional[int] = None
+    errors: Optional[List[str]] = None
+
+
+class BulkContactResponse(BaseModel):
+    """
+    Schema for the result of a bulk contact creation request.
+    """
+    created: int
+    duplicates: int
+    invalid: int
+    results: List[BulkContactResult]
+
+
+class ImportRowError(BaseModel):
+    """
+    Validation errors of a single row of an imported file.
+    """
+    row: int
+    errors: List[str]
+
+
+class ImportContactsResponse(BaseModel):
+    """
+    Schema for the report of a contacts import.
+    """
+    total: int
+    created: int
+    duplicates: int
+    invalid: int
+    errors: List[ImportRowError]
+
+
+class ImportProgress(BaseModel):
+    """
+    Schema for the progress of a running or finished contacts import.
+    """
+    status: Literal["running", "finished", "failed"]
+    processed: int
+    invalid: int
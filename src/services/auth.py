@@ -1,4 +1,6 @@
+import hashlib
 import logging
+import time
 
 from datetime import datetime, timedelta, UTC
 from typing import Optional
@@ -12,9 +14,11 @@ from jose import JWTError, jwt
 from src.conf.config import settings
 from src.database.database import get_db
 from src.database.models import User, UserRole
+from src.services.hashing import hashing_pool
+from src.services.local_cache import LocalCache
 from src.services.users import UserService
 from src.services.redis_cache import redis_cache
-from src.schemas.users import UserCacheModel
+from src.services.user_cache import cache_user, get_cached_user
 
 class Hash:
     """
@@ -48,6 +52,35 @@ class Hash:
         """
         return self.pwd_context.hash(password)
 
+    async def verify_password_async(self, plain_password, hashed_password):
+        """
+        Verifies a password on the hashing pool without blocking the
+        event loop.
+
+        Args:
+            plain_password (str): User's raw password.
+            hashed_password (str): Stored hashed password.
+
+        Returns:
+            bool: True if passwords match, False otherwise.
+        """
+        return await hashing_pool.run(
+            self.verify_password, plain_password, hashed_password
+        )
+
+    async def get_password_hash_async(self, password: str):
+        """
+        Generates a hashed password on the hashing pool without blocking
+        the event loop.
+
+        Args:
+            password (str): User's raw password.
+
+        Returns:
+            str: Hashed password.
+        """
+        return await hashing_pool.run(self.get_password_hash, password)
+
 
 oauth2_scheme = HTTPBearer()
 
@@ -70,7 +103,7 @@ async def create_access_token(data: dict, expires_delta: Optional[int] = None):
         expire = datetime.now(UTC) + timedelta(
             seconds=settings.JWT_EXPIRATION_SECONDS
         )
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "iat": datetime.now(UTC)})
     print("to_encode", to_encode)
     encoded_jwt = jwt.encode(
         to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM
@@ -78,6 +111,150 @@ async def create_access_token(data: dict, expires_delta: Optional[int] = None):
     return encoded_jwt
 
 
+async def user_claims(user: User) -> dict:
+    """
+    Build the access token claims of a user.
+
+    With `AUTH_STATELESS` enabled these claims are all that
+    `get_current_user` needs, so requests do not load the user. The
+    `tv` claim is the user's token version when the token is issued;
+    `revoke_tokens` moves the version on.
+
+    Args:
+        user (User): User the token is issued to.
+
+    Returns:
+        dict: Token payload without expiry.
+    """
+    return {
+        "sub": user.username,
+        "uid": user.id,
+        "email": user.email,
+        "role": UserRole(user.role).value,
+        "verified": user.is_verified,
+        "tv": await redis_cache.get_version(token_version_key(user.id)),
+    }
+
+
+class Principal:
+    """
+    Authenticated user described by the claims of an access token.
+
+    A plain object with slots: it is built on every request, so it
+    avoids both a database row and a pydantic model.
+    """
+
+    __slots__ = ("id", "username", "email", "role", "is_verified")
+
+    def __init__(self, payload: dict):
+        """
+        Read the user claims of a decoded access token.
+
+        Args:
+            payload (dict): Token payload produced from `user_claims`.
+        """
+        self.id = payload["uid"]
+        self.username = payload["sub"]
+        self.email = payload["email"]
+        self.role = UserRole(payload["role"])
+        self.is_verified = payload["verified"]
+
+
+def token_version_key(user_id: int) -> str:
+    """
+    Build the Redis key of a user's token version.
+
+    Args:
+        user_id (int): ID of the user.
+
+    Returns:
+        str: Redis key.
+    """
+    return f"user:token_version:{user_id}"
+
+
+# user id -> current token version, or None without Redis
+_token_versions = LocalCache(
+    settings.AUTH_REVOCATION_CACHE_SIZE, settings.AUTH_REVOCATION_CHECK_TTL
+)
+_MISSING = object()
+
+
+async def revoke_tokens(user_id: int):
+    """
+    Revoke every access token issued to the user so far.
+
+    Args:
+        user_id (int): ID of the user.
+    """
+    await redis_cache.bump_version(token_version_key(user_id))
+    _token_versions.pop(user_id)
+
+
+async def is_revoked(payload: dict) -> bool:
+    """
+    Check whether an access token carries an outdated token version.
+
+    The current version is read from Redis at most once per
+    `AUTH_REVOCATION_CHECK_TTL` seconds per user and worker, so most
+    requests check it without any I/O. A version lost from Redis is
+    recreated from the clock, which revokes older tokens rather than
+    reviving revoked ones.
+
+    Args:
+        payload (dict): Decoded token payload with `uid` and `tv`.
+
+    Returns:
+        bool: True if the token must be rejected.
+    """
+    user_id = payload["uid"]
+    version = _token_versions.get(user_id, _MISSING)
+    if version is _MISSING:
+        version = await redis_cache.get_version(token_version_key(user_id))
+        _token_versions.set(user_id, version)
+    if version is None:
+        return False
+    return (payload.get("tv") or 0) < version
+
+
+# sha256 of token -> verified payload, kept until the token expires
+_verified_tokens = LocalCache(settings.AUTH_TOKEN_CACHE_SIZE, 0)
+
+
+def decode_access_token(token: str) -> dict:
+    """
+    Verify an access token and return its payload.
+
+    Clients present the same token on every request, so with
+    `AUTH_TOKEN_CACHE` enabled the verified payload is remembered until
+    the token's `exp` and the signature is checked once per worker.
+    Tokens are keyed by their hash, so the cache holds no credentials.
+
+    Args:
+        token (str): Encoded JWT token.
+
+    Returns:
+        dict: Verified token payload; callers must not modify it.
+
+    Raises:
+        JWTError: If the token is invalid or expired.
+    """
+    if not settings.AUTH_TOKEN_CACHE:
+        return jwt.decode(
+            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
+        )
+    key = hashlib.sha256(token.encode()).digest()
+    payload = _verified_tokens.get(key)
+    if payload is None:
+        payload = jwt.decode(
+            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
+        )
+        if "exp" in payload:
+            _verified_tokens.set(key, payload,
+                                 ttl=payload["exp"] - time.time())
+    return payload
+
+
 async def get_current_user(
     token: HTTPAuthorizationCredentials = Depends(oauth2_scheme),
     db: Session = Depends(get_db),
@@ -89,6 +266,9 @@ async def get_current_user(
         token (HTTPAuthorizationCredentials): JWT token containing user credentials.
         db (Session): Database session.
 
+    With `AUTH_STATELESS` enabled, tokens carrying the user claims are
+    turned into a `Principal` without loading the user.
+
     Returns:
         User: Authenticated user object.
 
@@ -103,11 +283,7 @@ async def get_current_user(
 
     try:
         # Decode JWT token
-        payload = jwt.decode(
-            token.credentials,
-            settings.JWT_SECRET,
-            algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = decode_access_token(token.credentials)
         print("payload", payload)
         username = payload["sub"]
         if username is None:
@@ -116,28 +292,24 @@ async def get_current_user(
         logging.error(f"JWT Error: {e}")
         raise credentials_exception
 
-    user_data = await redis_cache.get(f"user:{username}")
-    if user_data:
-        logging.info(f"✅ Користувач {username} знайдений у кеші Redis")
-        return UserCacheModel(**user_data)  # 🔹 Використання правильної моделі
+    if settings.AUTH_STATELESS and "uid" in payload:
+        if await is_revoked(payload):
+            raise credentials_exception
+        return Principal(payload)
+
+    cached_user = await get_cached_user(username)
+    if cached_user:
+        logging.info(f"✅ Користувач {username} знайдений у кеші")
+        return cached_user
 
-    # Якщо користувача немає в Redis – шукаємо в базі
+    # Якщо користувача немає в кеші – шукаємо в базі
     user_service = UserService(db)
     user = await user_service.get_user_by_username(username)
     if not user:
         raise credentials_exception
 
-    # Кешуємо в Redis
-    cached_user = UserCacheModel(
-        id=user.id,
-        username=user.username,
-        email=user.email,
-        is_verified=user.is_verified,
-        role=user.role
-    ).dict()
-
-    await redis_cache.set(f"user:{user.username}", cached_user, expire=3600)
-    logging.info(f"💾 Користувач {username} закешований у Redis")
+    await cache_user(user)
+    logging.info(f"💾 Користувач {username} закешований")
 
     return user
 
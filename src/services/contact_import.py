@@ -0,0 +1,119 @@
+import csv
+import io
+import re
+from itertools import islice
+from typing import BinaryIO, Iterable, Iterator, List
+
+# Formatting characters people put into phone numbers
+PHONE_SEPARATORS = re.compile(r"[\s\-().]")
+
+
+def iter_csv_records(file: BinaryIO) -> Iterator[dict]:
+    """
+    Read contacts from a CSV file one row at a time.
+
+    The header row must name the contact fields (name, surname, email,
+    phone, birthday, info); unknown columns are ignored, so a file
+    produced by the contacts export can be imported back.
+
+    :param file: Binary file object of the upload.
+    :return: Iterator of raw contact dictionaries.
+    """
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        yield from csv.DictReader(text)
+    finally:
+        text.detach()
+
+
+def _unfold(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Join vCard continuation lines (RFC 6350, section 3.2).
+
+    :param lines: Raw text lines.
+    :return: Iterator of logical lines.
+    """
+    current = None
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = line
+    if current is not None:
+        yield current
+
+
+def _unescape(value: str) -> str:
+    """
+    Decode vCard text value escapes.
+
+    :param value: Escaped property value.
+    :return: Plain text value.
+    """
+    return (
+        value.replace("\\n", "\n").replace("\\N", "\n")
+        .replace("\\,", ",").replace("\\;", ";").replace("\\\\", "\\")
+    )
+
+
+def iter_vcard_records(file: BinaryIO) -> Iterator[dict]:
+    """
+    Read contacts from a vCard file one card at a time.
+
+    Uses N (or FN) for the name and surname, the first EMAIL and TEL,
+    BDAY and NOTE.
+
+    :param file: Binary file object of the upload.
+    :return: Iterator of raw contact dictionaries.
+    """
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        record = None
+        for line in _unfold(text):
+            prop, _, value = line.partition(":")
+            name = prop.split(";", 1)[0].rsplit(".", 1)[-1].upper()
+            if name == "BEGIN" and value.upper() == "VCARD":
+                record = {}
+            elif record is None:
+                continue
+            elif name == "END":
+                yield record
+                record = None
+            elif name == "N":
+                parts = value.split(";")
+                record["surname"] = _unescape(parts[0])
+                if len(parts) > 1:
+                    record["name"] = _unescape(parts[1])
+            elif name == "FN" and "name" not in record:
+                first, _, last = _unescape(value).partition(" ")
+                record["name"] = first
+                record.setdefault("surname", last)
+            elif name == "EMAIL":
+                record.setdefault("email", value.strip())
+            elif name == "TEL":
+                record.setdefault("phone", PHONE_SEPARATORS.sub("", value))
+            elif name == "BDAY":
+                digits = value.strip()
+                if re.fullmatch(r"\d{8}", digits):
+                    digits = f"{digits[:4]}-{digits[4:6]}-{digits[6:]}"
+                record["birthday"] = digits
+            elif name == "NOTE":
+                record["info"] = _unescape(value)
+    finally:
+        text.detach()
+
+
+def chunked(iterable: Iterable, size: int) -> Iterator[List]:
+    """
+    Split an iterable into lists of at most `size` items.
+
+    :param iterable: Items to split.
+    :param size: Maximum chunk length.
+    :return: Iterator of chunks.
+    """
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
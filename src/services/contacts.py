@@ -1,8 +1,76 @@
-from fastapi import HTTPException, status
+import csv
+import hashlib
+import io
+import json
+import secrets
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List
+
+from fastapi import HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.conf.config import settings
 from src.database.models import User
-from src.repository.contacts import ContactRepository
-from src.schemas.contacts import ContactModel
+from src.repository.contacts import (
+    ContactRepository,
+    normalize_email,
+    normalize_phone,
+)
+from src.schemas.contacts import ContactModel, ContactResponse, ContactRow
+from src.services.contact_import import (
+    chunked,
+    iter_csv_records,
+    iter_vcard_records,
+)
+from src.services.events import contact_events
+from src.services.pagination import decode_cursor, encode_cursor
+from src.services.redis_cache import cache_stats, redis_cache
+
+# Columns of a full contact read, in response order
+CONTACT_FIELDS = list(ContactResponse.model_fields)
+
+# Built once: dumping rows through it skips model validation entirely
+CONTACT_ROWS = TypeAdapter(List[ContactRow])
+
+
+def format_validation_errors(error: ValidationError) -> List[str]:
+    """
+    Flatten pydantic validation errors into "field: message" strings.
+
+    :param error: Raised validation error.
+    :return: Human readable error messages.
+    """
+    return [
+        f"{'.'.join(map(str, err['loc']))}: {err['msg']}"
+        for err in error.errors()
+    ]
+
+
+def parse_fields(fields: str | None, sort: str = "id") -> List[str]:
+    """
+    Parse a comma-separated `fields` query parameter.
+
+    The contact ID and the sort key are always included, so that
+    clients can address the returned contacts and page through them.
+
+    :param fields: Requested field names, e.g. "name,phone".
+    :param sort: Field the contacts are sorted by.
+    :return: Column names to load; all of them if `fields` is empty.
+    :raises HTTPException: If an unknown field is requested.
+    """
+    if not fields:
+        return CONTACT_FIELDS
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = set(requested) - set(CONTACT_FIELDS)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+        )
+    return list(dict.fromkeys(["id", sort, *requested]))
 
 
 class ContactService:
@@ -16,8 +84,169 @@ class ContactService:
 
         :param db: Async database session.
         """
+        self.db = db
         self.repository = ContactRepository(db)
 
+    @staticmethod
+    def _serialize(rows) -> List[dict]:
+        """
+        Convert contact row mappings into JSON-ready dictionaries.
+
+        Rows come straight from Core selects, so no ORM instances or
+        response models are built for them.
+
+        :param rows: Row mappings of contacts.
+        :return: List of contact dictionaries.
+        """
+        return CONTACT_ROWS.dump_python(
+            [dict(row) for row in rows], mode="json"
+        )
+
+    @staticmethod
+    def _digest(data) -> str:
+        """
+        Hash JSON-serializable data into a stable hex digest.
+
+        :param data: Data to hash.
+        :return: SHA-1 hex digest.
+        """
+        return hashlib.sha1(
+            json.dumps(data, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    async def get_etag(
+        self, route: str, user: User, params: dict
+    ) -> str | None:
+        """
+        Build an ETag for a contacts read without querying the database.
+
+        The tag is derived from the user's contacts version, which changes
+        on every write, and the query parameters of the read.
+
+        :param route: Name of the read ("list", "contact", ...).
+        :param user: Current authenticated user.
+        :param params: Query parameters the result depends on.
+        :return: Strong ETag, or None if Redis is not available.
+        """
+        version = await redis_cache.get_version(f"contacts:version:{user.id}")
+        if version is None:
+            return None
+        return f'"{self._digest([user.id, version, route, params])}"'
+
+    def content_etag(self, data) -> str:
+        """
+        Build an ETag from the response data itself.
+
+        Used when no contacts version is available.
+
+        :param data: JSON-ready response data.
+        :return: Strong ETag.
+        """
+        return f'"{self._digest(data)}"'
+
+    def _cache_key(
+        self, route: str, user: User, version: int, params: dict
+    ) -> str:
+        """
+        Build the Redis key of a cached contacts read.
+
+        :param route: Name of the cached read ("list", "contact", ...).
+        :param user: Current authenticated user.
+        :param version: Current contacts version of the user.
+        :param params: Query parameters the result depends on.
+        :return: Cache key.
+        """
+        return f"contacts:{user.id}:{version}:{route}:{self._digest(params)}"
+
+    async def _cached(
+        self,
+        route: str,
+        user: User,
+        params: dict,
+        loader: Callable[[], Awaitable[Any]],
+    ):
+        """
+        Return a contacts read from Redis, or load and cache it.
+
+        Keys include the user's contacts version, so bumping the version
+        on any write invalidates all of the user's entries at once.
+
+        :param route: Name of the cached read ("list", "contact", ...).
+        :param user: Current authenticated user.
+        :param params: Query parameters the result depends on.
+        :param loader: Coroutine function loading JSON-ready data.
+        :return: Cached or freshly loaded data.
+        """
+        version = await redis_cache.get_version(f"contacts:version:{user.id}")
+        if version is None:
+            return await loader()
+
+        key = self._cache_key(route, user, version, params)
+        cached = await redis_cache.get(key)
+        if cached is not None:
+            cache_stats.hit(f"contacts:{route}")
+            return cached
+
+        cache_stats.miss(f"contacts:{route}")
+        value = await loader()
+        ttl = {
+            "list": settings.CONTACTS_CACHE_TTL_LIST,
+            "contact": settings.CONTACTS_CACHE_TTL_CONTACT,
+            "birthdays": settings.CONTACTS_CACHE_TTL_BIRTHDAYS,
+            "lookup": settings.CONTACTS_CACHE_TTL_LOOKUP,
+            "count": settings.CONTACTS_CACHE_TTL_LIST,
+        }[route]
+        await redis_cache.set(key, value, expire=ttl)
+        return value
+
+    async def _invalidate(self, user: User, event: str, **details):
+        """
+        Invalidate all cached contact reads of the user, drop the user's
+        contact counter if the change affects it and announce the change
+        on the user's event stream.
+
+        The counter is dropped rather than adjusted: a recount running
+        between the commit and this call may already include the change,
+        and is stored because the version has not been bumped yet.
+
+        :param user: Owner of the changed contacts.
+        :param event: Kind of change ("created", "updated", ...).
+        :param details: Extra event data, e.g. the changed contact IDs.
+        """
+        await redis_cache.bump_version(f"contacts:version:{user.id}")
+        counted = {
+            "created": details.get("ids"),
+            "imported": details.get("created"),
+            "deleted": details.get("ids"),
+        }.get(event)
+        if counted:
+            await redis_cache.delete(f"contacts:count:{user.id}")
+        await redis_cache.publish(
+            f"contacts:events:{user.id}", {"type": event, **details}
+        )
+
+    def stream_events(self, user: User) -> AsyncIterator[dict | None]:
+        """
+        Subscribe to the contact change events of the user.
+
+        Events are published by every contact mutation through Redis
+        pub/sub, so they reach subscribers on all workers. Each worker
+        receives them over one shared subscription. None is produced
+        every `CONTACTS_STREAM_HEARTBEAT` seconds without events.
+
+        :param user: Current authenticated user.
+        :return: Async iterator of events and None heartbeats.
+        :raises HTTPException: If Redis is not available.
+        """
+        if redis_cache.redis is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Contact events are not available",
+            )
+        return contact_events.subscribe(
+            f"contacts:events:{user.id}", settings.CONTACTS_STREAM_HEARTBEAT
+        )
+
     async def create_contact(self, body: ContactModel, user: User):
         """
         Create a new contact if it does not already exist.
@@ -25,16 +254,200 @@ class ContactService:
         :param body: Contact data.
         :param user: Current authenticated user.
         :return: Created contact object.
-        :raises HTTPException: If a contact with the same email or
-        phone exists.
+        :raises HTTPException: If the user already has a contact with the
+        same email or phone.
         """
-        if await self.repository.is_contact_exists(body.email, body.phone):
+        contact = await self.repository.create_contact(body, user)
+        if contact is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Contact with '{body.email}' email or "
                 f"'{body.phone}' phone number already exists.",
             )
-        return await self.repository.create_contact(body, user)
+        await self._invalidate(user, "created", ids=[contact.id])
+        return contact
+
+    async def create_contacts_bulk(
+        self, items: List[Dict[str, Any]], user: User
+    ):
+        """
+        Validate and create many contacts at once.
+
+        :param items: Raw contact payloads.
+        :param user: Current authenticated user.
+        :return: Counters and a per-item created/duplicate/invalid result.
+        :raises HTTPException: If too many items are sent at once.
+        """
+        if len(items) > settings.CONTACTS_BULK_MAX_ITEMS:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"No more than {settings.CONTACTS_BULK_MAX_ITEMS} "
+                f"contacts can be created at once.",
+            )
+
+        results = []
+        valid = []
+        for index, item in enumerate(items):
+            try:
+                valid.append((index, ContactModel.model_validate(item)))
+            except ValidationError as e:
+                results.append({
+                    "index": index,
+                    "status": "invalid",
+                    "errors": format_validation_errors(e),
+                })
+
+        created = await self.repository.create_contacts(
+            [body for _, body in valid], user
+        )
+        if created:
+            await self._invalidate(
+                user, "created",
+                ids=[contact_id for contact_id, _, _ in created],
+            )
+        # Email alone is ambiguous: an item may be skipped for its phone
+        # while a later item with the same email is inserted
+        ids = {
+            (email, phone): contact_id for contact_id, email, phone in created
+        }
+        for index, body in valid:
+            contact_id = ids.pop((body.email, body.phone), None)
+            results.append({
+                "index": index,
+                "status": "duplicate" if contact_id is None else "created",
+                "id": contact_id,
+            })
+
+        results.sort(key=lambda result: result["index"])
+        return {
+            "created": len(created),
+            "duplicates": len(valid) - len(created),
+            "invalid": len(items) - len(valid),
+            "results": results,
+        }
+
+    async def import_contacts(self, file: UploadFile, user: User):
+        """
+        Import contacts from an uploaded CSV or vCard file.
+
+        The file is parsed incrementally and validated in chunks of
+        `CONTACTS_IMPORT_CHUNK_SIZE` rows on the thread pool, so large
+        files do not block the event loop. Progress is published to Redis
+        after every chunk and once the import has finished or failed, see
+        `get_import_progress`. Only one import per user runs at a time.
+
+        :param file: Uploaded CSV or vCard file.
+        :param user: Current authenticated user.
+        :return: Import report with counters and per-row errors.
+        :raises HTTPException: If the file type is not supported, the
+        file cannot be decoded or another import of the user is running.
+        """
+        filename = (file.filename or "").lower()
+        content_type = file.content_type or ""
+        if filename.endswith((".vcf", ".vcard")) or "vcard" in content_type:
+            records = iter_vcard_records(file.file)
+        elif filename.endswith(".csv") or content_type == "text/csv":
+            records = iter_csv_records(file.file)
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail="Only CSV and vCard files can be imported",
+            )
+
+        progress_key = f"contacts:import:{user.id}"
+        report = {"total": 0, "invalid": 0, "errors": []}
+
+        chunks = chunked(
+            enumerate(records, start=1), settings.CONTACTS_IMPORT_CHUNK_SIZE
+        )
+
+        def next_chunk():
+            # Reads the upload and validates one chunk; runs in a thread
+            chunk = next(chunks, [])
+            bodies, failures = [], []
+            for row, record in chunk:
+                try:
+                    bodies.append(ContactModel.model_validate(record))
+                except ValidationError as e:
+                    failures.append((row, e))
+            return len(chunk), bodies, failures
+
+        async def validated_chunks():
+            while True:
+                size, bodies, failures = await run_in_threadpool(next_chunk)
+                if not size:
+                    return
+                for row, e in failures:
+                    report["invalid"] += 1
+                    if (len(report["errors"])
+                            < settings.CONTACTS_IMPORT_MAX_ERRORS):
+                        report["errors"].append({
+                            "row": row,
+                            "errors": format_validation_errors(e),
+                        })
+                report["total"] += size
+                await redis_cache.set(progress_key, {
+                    "status": "running",
+                    "processed": report["total"],
+                    "invalid": report["invalid"],
+                })
+                if bodies:
+                    yield bodies
+
+        lock_key = f"{progress_key}:lock"
+        lock_value = {"token": secrets.token_hex(16)}
+        if not await redis_cache.add(
+            lock_key, lock_value, expire=settings.CONTACTS_IMPORT_LOCK_TTL
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Another import is still in progress",
+            )
+        outcome = "failed"
+        try:
+            try:
+                created = await self.repository.import_contacts(
+                    validated_chunks(), user
+                )
+            except (UnicodeDecodeError, csv.Error) as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Could not read the file: {e}",
+                )
+            outcome = "finished"
+        finally:
+            await redis_cache.set(progress_key, {
+                "status": outcome,
+                "processed": report["total"],
+                "invalid": report["invalid"],
+            })
+            await redis_cache.delete_if_equals(lock_key, lock_value)
+        if created:
+            await self._invalidate(user, "imported", created=created)
+
+        return {
+            "total": report["total"],
+            "created": created,
+            "duplicates": report["total"] - report["invalid"] - created,
+            "invalid": report["invalid"],
+            "errors": report["errors"],
+        }
+
+    async def get_import_progress(self, user: User):
+        """
+        Retrieve the progress of the user's latest contacts import.
+
+        :param user: Current authenticated user.
+        :return: Progress counters.
+        :raises HTTPException: If no import progress is known.
+        """
+        progress = await redis_cache.get(f"contacts:import:{user.id}")
+        if progress is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="No import in progress",
+            )
+        return progress
 
     async def get_contacts(
         self,
@@ -43,7 +456,12 @@ class ContactService:
             email: str,
             skip: int,
             limit: int,
-            user: User
+            user: User,
+            cursor: str | None = None,
+            q: str | None = None,
+            fields: str | None = None,
+            sort: str = "id",
+            order: str = "asc",
     ):
         """
         Retrieve a list of contacts with optional filtering.
@@ -54,52 +472,479 @@ class ContactService:
         :param skip: Number of records to skip.
         :param limit: Maximum number of records to return.
         :param user: Current authenticated user.
-        :return: List of contacts.
+        :param cursor: Opaque cursor from a previous page (optional).
+        When given, `skip` is ignored.
+        :param q: Search term for name, surname and email (optional).
+        :param fields: Comma-separated fields to return (optional).
+        :param sort: Field to sort by: "id", "name", "surname",
+        "birthday", "created_at" or "updated_at".
+        :param order: Sort direction, "asc" or "desc".
+        :return: List of contact dictionaries.
+        :raises HTTPException: If the cursor is malformed or combined
+        with a relevance-ordered search.
         """
+        after = None
+        if cursor and q:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor pagination is not supported with 'q' search",
+            )
+        if cursor:
+            after = self._sort_position(cursor, sort)
+
+        columns = parse_fields(fields, sort)
+
+        async def load():
+            return self._serialize(await self.repository.get_contacts(
+                name, surname, email, skip, limit, user, after, q, columns,
+                sort, order == "desc",
+            ))
+
+        params = {
+            "name": name, "surname": surname, "email": email, "skip": skip,
+            "limit": limit, "after": after, "q": q, "fields": columns,
+            "sort": sort, "order": order,
+        }
+        return await self._cached("list", user, params, load)
+
+    async def count_contacts(
+        self,
+        user: User,
+        name: str | None = None,
+        surname: str | None = None,
+        email: str | None = None,
+        q: str | None = None,
+    ) -> tuple[int, bool]:
+        """
+        Count the contacts a list request pages through.
+
+        Without filters this reads an exact per-user counter from Redis,
+        which every create, import and delete drops; it is recounted
+        when missing. A recount is stored only if no write bumped the
+        contacts version meanwhile, as it may have missed that write.
+        Filtered counts are planner estimates on
+        PostgreSQL and exact counts elsewhere, cached like other reads,
+        so pages do not run `COUNT(*)` each time.
+
+        :param user: Current authenticated user.
+        :param name: Filter by name (optional).
+        :param surname: Filter by surname (optional).
+        :param email: Filter by email (optional).
+        :param q: Search term for name, surname and email (optional).
+        :return: The count and whether it is exact.
+        """
+        if not (name or surname or email or q):
+            key = f"contacts:count:{user.id}"
+            count = await redis_cache.get(key)
+            if count is None:
+                version_key = f"contacts:version:{user.id}"
+                version = await redis_cache.get_version(version_key)
+                count = await self.repository.count_contacts(user)
+                await redis_cache.add_if_version(
+                    key, count, version_key, version,
+                    expire=settings.CONTACTS_CACHE_TTL_COUNT,
+                )
+            return count, True
+
+        async def load():
+            estimate = await self.repository.estimate_contacts(
+                user, name, surname, email, q
+            )
+            if estimate is not None:
+                return {"count": estimate, "exact": False}
+            count = await self.repository.count_contacts(
+                user, name, surname, email, q
+            )
+            return {"count": count, "exact": True}
+
+        params = {"name": name, "surname": surname, "email": email, "q": q}
+        result = await self._cached("count", user, params, load)
+        return result["count"], result["exact"]
+
+    @staticmethod
+    def _sort_position(cursor: str, sort: str) -> tuple:
+        """
+        Decode a contact list cursor into the keyset position it holds.
+
+        :param cursor: Cursor token from `next_cursor`.
+        :param sort: Field the list is sorted by.
+        :return: Sort key (unless sorting by ID) and ID of the last
+        contact of the previous page.
+        :raises HTTPException: If the cursor is malformed.
+        """
+        *key, contact_id = decode_cursor(cursor, 1 if sort == "id" else 2)
+        try:
+            if not isinstance(contact_id, int):
+                raise ValueError(contact_id)
+            if sort == "birthday":
+                key = [date.fromisoformat(key[0])]
+            elif sort in ("created_at", "updated_at"):
+                key = [datetime.fromisoformat(key[0])]
+            elif key and not isinstance(key[0], str):
+                raise ValueError(key[0])
+        except (TypeError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            )
+        return (*key, contact_id)
+
+    @staticmethod
+    def next_cursor(
+        contacts, limit: int, q: str | None = None, sort: str = "id"
+    ) -> str | None:
+        """
+        Build the cursor pointing past the last contact of a page.
+
+        :param contacts: Contact dictionaries of the current page.
+        :param limit: Page size that was requested.
+        :param q: Search term of the request; relevance-ordered pages
+        have no cursor.
+        :param sort: Field the page is sorted by.
+        :return: Cursor token, or None if there is no next cursor.
+        """
+        if q or limit <= 0 or len(contacts) < limit:
+            return None
+        last = contacts[-1]
+        if sort == "id":
+            return encode_cursor(last["id"])
+        return encode_cursor(last[sort], last["id"])
+
+    @staticmethod
+    def _feed_position(timestamp: str | None, row_id: int | None):
+        """
+        Decode one `(timestamp, id)` position of a changes feed token.
+
+        :param timestamp: ISO timestamp of the last seen row.
+        :param row_id: ID of the last seen row.
+        :return: Keyset tuple, or None if no row has been seen yet.
+        :raises ValueError: If the values are malformed.
+        """
+        if row_id is None:
+            return None
+        if not isinstance(row_id, int):
+            raise ValueError(row_id)
+        return datetime.fromisoformat(timestamp), row_id
+
+    @staticmethod
+    def _settle(position: tuple | None, horizon: datetime, full: bool):
+        """
+        Hold a changes feed position back to the commit horizon.
+
+        Rows stamped after the horizon may still be joined by rows of
+        transactions that have not committed yet, so the next sync scans
+        them again. Positions inside a full page are kept, letting the
+        client page forward; the last page of a sync settles it.
+
+        :param position: Keyset position reached by this response.
+        :param horizon: Oldest change time that may still be uncommitted.
+        :param full: Whether the page was full and more rows are waiting.
+        :return: Position to put into the next token.
+        """
+        if position is None or full:
+            return position
+        return min(position, (horizon, 0))
+
+    async def get_changes(self, user: User, since: str | None, limit: int):
+        """
+        Retrieve the contacts changed and deleted since a sync token.
 
-        return await self.repository.get_contacts(
-            name, surname, email, skip, limit, user
+        Without a token, all contacts are returned and deletions made so
+        far are skipped, as the client has nothing to delete yet. Every
+        response carries the token to pass as `since` next time. Changes
+        of the last `CONTACTS_CHANGES_MAX_TXN_AGE` seconds are sent again
+        by the next sync, so clients must apply changes idempotently.
+
+        :param user: Current authenticated user.
+        :param since: Token returned by the previous sync (optional).
+        :param limit: Maximum number of changed contacts and of deleted
+        contacts per response.
+        :return: Changed contacts, deleted contact IDs, the next token
+        and whether more changes are waiting.
+        :raises HTTPException: If the token is malformed.
+        """
+        horizon = await self.repository.get_feed_horizon(
+            settings.CONTACTS_CHANGES_MAX_TXN_AGE
+        )
+        if since:
+            values = decode_cursor(since, 4)
+            try:
+                after = self._feed_position(*values[:2])
+                deleted_after = self._feed_position(*values[2:])
+            except (TypeError, ValueError):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid cursor",
+                )
+            tombstones = await self.repository.get_tombstones(
+                user, deleted_after, limit
+            )
+        else:
+            after = None
+            last = await self.repository.get_last_tombstone(user)
+            deleted_after = last and (last["deleted_at"], last["id"])
+            tombstones = []
+
+        contacts = await self.repository.get_changed_contacts(
+            user, after, limit, CONTACT_FIELDS
+        )
+        if contacts:
+            after = (contacts[-1]["updated_at"], contacts[-1]["id"])
+        if tombstones:
+            last = tombstones[-1]
+            deleted_after = (last["deleted_at"], last["id"])
+        after = self._settle(after, horizon, len(contacts) == limit)
+        deleted_after = self._settle(
+            deleted_after, horizon, len(tombstones) == limit
         )
 
-    async def get_contact(self, contact_id: int, user: User):
+        return {
+            "changes": self._serialize(contacts),
+            "deleted": [tombstone["contact_id"] for tombstone in tombstones],
+            "next": encode_cursor(
+                *(after or (None, None)), *(deleted_after or (None, None))
+            ),
+            "has_more": len(contacts) == limit or len(tombstones) == limit,
+        }
+
+    async def export_contacts(
+        self, user: User, export_format: str
+    ) -> AsyncIterator[str]:
+        """
+        Serialize all contacts of the user one row at a time.
+
+        The export runs in its own session, because the response body is
+        streamed after the request-scoped session has been closed.
+
+        :param user: Current authenticated user.
+        :param export_format: Either "ndjson" or "csv".
+        :return: Async iterator of NDJSON lines or CSV rows.
+        """
+        fields = CONTACT_FIELDS
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=fields)
+
+        def csv_row(row=None) -> str:
+            buffer.seek(0)
+            buffer.truncate()
+            if row is None:
+                writer.writeheader()
+            else:
+                writer.writerow(row)
+            return buffer.getvalue()
+
+        if export_format == "csv":
+            yield csv_row()
+
+        async with AsyncSession(self.db.bind) as session:
+            repository = ContactRepository(session)
+            async for contact in repository.stream_contacts(user):
+                item = ContactResponse.model_validate(contact)
+                if export_format == "csv":
+                    yield csv_row(item.model_dump(mode="json"))
+                else:
+                    yield item.model_dump_json() + "\n"
+
+    async def get_contact(
+        self, contact_id: int, user: User, fields: str | None = None
+    ):
         """
         Retrieve a specific contact by ID.
 
         :param contact_id: Contact ID.
         :param user: Current authenticated user.
-        :return: Contact object.
+        :param fields: Comma-separated fields to return (optional).
+        :return: Contact dictionary.
         :raises HTTPException: If the contact is not found.
         """
-        contact = await self.repository.get_contact_by_id(contact_id, user)
-        if contact is None:
+        columns = parse_fields(fields)
+
+        async def load():
+            contact = await self.repository.get_contact_by_id(
+                contact_id, user, columns
+            )
+            if contact is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Contact not found",
+                )
+            return self._serialize([contact])[0]
+
+        params = {"id": contact_id, "fields": columns}
+        return await self._cached("contact", user, params, load)
+
+    async def suggest_contacts(self, prefix: str, limit: int, user: User):
+        """
+        Suggest contacts whose display name starts with a prefix.
+
+        :param prefix: Beginning of "name surname", any letter case.
+        :param limit: Maximum number of suggestions.
+        :param user: Current authenticated user.
+        :return: List of dictionaries with `id` and `display_name`.
+        """
+        prefix = prefix.lstrip()
+        if not prefix:
+            return []
+        rows = await self.repository.suggest_contacts(prefix, limit, user)
+        return [dict(row) for row in rows]
+
+    async def lookup_contacts(
+        self, user: User, phone: str | None = None, email: str | None = None
+    ):
+        """
+        Find the contacts with exactly this phone number and/or email.
+
+        :param user: Current authenticated user.
+        :param phone: Phone number in any formatting (optional).
+        :param email: Email address in any letter case (optional).
+        :return: List of matching contact dictionaries.
+        :raises HTTPException: If neither phone nor email is given.
+        """
+        if not phone and not email:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Contact not found",
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Either phone or email is required",
             )
-        return contact
+
+        async def load():
+            return self._serialize(await self.repository.lookup_contacts(
+                user, phone, email, CONTACT_FIELDS
+            ))
+
+        # Differently formatted queries for one number share an entry
+        params = {
+            "phone": normalize_phone(phone) if phone else None,
+            "email": normalize_email(email) if email else None,
+        }
+        return await self._cached("lookup", user, params, load)
+
+    async def get_contacts_batch(self, ids: str, user: User):
+        """
+        Retrieve many contacts by ID at once.
+
+        Contacts are taken from the same per-contact cache entries as
+        `get_contact`, fetched with one MGET; the rest are loaded with a
+        single query and cached.
+
+        :param ids: Comma-separated contact IDs, e.g. "1,2,3".
+        :param user: Current authenticated user.
+        :return: Found contacts in the requested order and the IDs that
+        do not exist or belong to another user.
+        :raises HTTPException: If the IDs are malformed or too many.
+        """
+        try:
+            contact_ids = list(dict.fromkeys(
+                int(contact_id) for contact_id in ids.split(",")
+                if contact_id.strip()
+            ))
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="ids must be a comma-separated list of integers",
+            )
+        if len(contact_ids) > settings.CONTACTS_BATCH_MAX_IDS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"No more than {settings.CONTACTS_BATCH_MAX_IDS} "
+                f"contacts can be looked up at once.",
+            )
+
+        found = {}
+        keys = {}
+        version = await redis_cache.get_version(f"contacts:version:{user.id}")
+        if version is not None:
+            keys = {
+                contact_id: self._cache_key(
+                    "contact", user, version,
+                    {"id": contact_id, "fields": CONTACT_FIELDS},
+                )
+                for contact_id in contact_ids
+            }
+            cached = await redis_cache.get_many(list(keys.values()))
+            for contact_id, contact in zip(contact_ids, cached):
+                if contact is None:
+                    cache_stats.miss("contacts:contact")
+                else:
+                    cache_stats.hit("contacts:contact")
+                    found[contact_id] = contact
+
+        missing = [
+            contact_id for contact_id in contact_ids if contact_id not in found
+        ]
+        if missing:
+            loaded = {
+                contact["id"]: contact
+                for contact in self._serialize(
+                    await self.repository.get_contacts_by_ids(
+                        missing, user, CONTACT_FIELDS
+                    )
+                )
+            }
+            found.update(loaded)
+            if keys and loaded:
+                await redis_cache.set_many(
+                    {keys[contact_id]: contact
+                     for contact_id, contact in loaded.items()},
+                    expire=settings.CONTACTS_CACHE_TTL_CONTACT,
+                )
+
+        return {
+            "contacts": [
+                found[contact_id] for contact_id in contact_ids
+                if contact_id in found
+            ],
+            "missing": [
+                contact_id for contact_id in contact_ids
+                if contact_id not in found
+            ],
+        }
 
     async def update_contact(self,
                              contact_id: int,
                              body: ContactModel,
-                             user: User
+                             user: User,
+                             partial: bool = False,
                              ):
         """
         Update an existing contact.
 
+        A partial update without fields changes nothing: the contact is
+        returned as is, without a write, cache invalidation or event.
+
         :param contact_id: Contact ID.
         :param body: Updated contact data.
         :param user: Current authenticated user.
+        :param partial: Only change the fields that were sent.
         :return: Updated contact object.
-        :raises HTTPException: If the contact is not found.
+        :raises HTTPException: If the contact is not found or another
+        contact already has the new email or phone.
         """
-        updated_contact = await self.repository.update_contact(
-            contact_id, body, user
-        )
+        if partial and not body.model_dump(exclude_unset=True):
+            contact = await self.repository.get_contact_by_id(
+                contact_id, user
+            )
+            if contact is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Contact not found",
+                )
+            return contact
+        try:
+            updated_contact = await self.repository.update_contact(
+                contact_id, body, user, partial
+            )
+        except IntegrityError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Contact with this email or phone number "
+                "already exists.",
+            )
         if updated_contact is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Contact not found",
             )
+        await self._invalidate(user, "updated", ids=[contact_id])
         return updated_contact
 
     async def remove_contact(self, contact_id: int, user: User):
@@ -119,14 +964,29 @@ class ContactService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Contact not found",
             )
+        await self._invalidate(user, "deleted", ids=[contact_id])
         return deleted_contact
 
-    async def get_upcoming_birthdays(self, days: int, user: User):
+    async def get_upcoming_birthdays(
+        self, days: int, user: User, fields: str | None = None
+    ):
         """
        Retrieve a list of contacts with upcoming birthdays.
 
        :param days: Number of days to check for upcoming birthdays.
        :param user: Current authenticated user.
-       :return: List of contacts with upcoming birthdays.
+       :param fields: Comma-separated fields to return (optional).
+       :return: List of contact dictionaries with upcoming birthdays.
        """
-        return await self.repository.get_upcoming_birthdays(days, user)
+        columns = parse_fields(fields)
+
+        async def load():
+            return self._serialize(
+                await self.repository.get_upcoming_birthdays(
+                    days, user, columns
+                )
+            )
+
+        # The result depends on the current date as well
+        params = {"days": days, "today": date.today(), "fields": columns}
+        return await self._cached("birthdays", user, params, load)
@@ -0,0 +1,118 @@
+import asyncio
+import logging
+from collections import defaultdict
+from typing import AsyncIterator
+
+from redis.exceptions import RedisError
+
+from src.conf.config import settings
+from src.services.redis_cache import redis_cache
+
+# Put into the queue of a subscriber that fell too far behind
+_OVERFLOW = object()
+
+
+class EventHub:
+    """
+    Fans Redis pub/sub messages out to the subscribers of one worker.
+
+    The worker holds a single pattern subscription, whatever the number
+    of subscribers, and hands each message to the in-process queues of
+    the subscribers of its channel. Open event streams therefore do not
+    take connections from the Redis pool used by the caches.
+    """
+
+    def __init__(self, pattern: str, queue_size: int):
+        """
+        Initialize the hub.
+
+        Args:
+            pattern (str): Redis channel pattern to subscribe to.
+            queue_size (int): Messages a subscriber may fall behind
+                before it is disconnected.
+        """
+        self.pattern = pattern
+        self.queue_size = queue_size
+        self.queues: dict[str, set[asyncio.Queue]] = defaultdict(set)
+        self.listener: asyncio.Task | None = None
+
+    async def subscribe(
+        self, channel: str, timeout: float
+    ) -> AsyncIterator[dict | None]:
+        """
+        Yield the messages published to a channel.
+
+        Yields None after `timeout` seconds without messages, so the
+        caller can send a keep-alive. Ends when the subscriber falls more
+        than `queue_size` messages behind; the client has to reconnect
+        and resynchronize.
+
+        Args:
+            channel (str): Channel matching the hub's pattern.
+            timeout (float): Seconds to wait for a message.
+
+        Returns:
+            AsyncIterator[dict | None]: Messages and None heartbeats.
+        """
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self.queues[channel].add(queue)
+        if self.listener is None or self.listener.done():
+            self.listener = asyncio.create_task(self.listen())
+        try:
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                if message is _OVERFLOW:
+                    return
+                yield message
+        finally:
+            subscribers = self.queues[channel]
+            subscribers.discard(queue)
+            if not subscribers:
+                del self.queues[channel]
+
+    def dispatch(self, channel: str, message: dict):
+        """
+        Hand a message to every subscriber of its channel.
+
+        Args:
+            channel (str): Channel the message was published to.
+            message (dict): Decoded message.
+        """
+        for queue in self.queues.get(channel, ()):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(_OVERFLOW)
+
+    async def listen(self):
+        """
+        Receive messages of the pattern subscription until cancelled,
+        re-subscribing after connection errors.
+        """
+        while True:
+            try:
+                async for channel, message in redis_cache.psubscribe(
+                    self.pattern, timeout=60
+                ):
+                    self.dispatch(channel, message)
+            except RedisError as e:
+                logging.error(f"Subscription to {self.pattern} lost: {e}")
+            await asyncio.sleep(1)
+
+    def close(self):
+        """
+        Stop listening for messages.
+        """
+        if self.listener is not None:
+            self.listener.cancel()
+
+
+contact_events = EventHub(
+    "contacts:events:*", settings.CONTACTS_STREAM_QUEUE_SIZE
+)
@@ -0,0 +1,82 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from fastapi import HTTPException, status
+
+from src.conf.config import settings
+
+
+class HashingPool:
+    """
+    Runs blocking password hashing outside of the event loop.
+
+    bcrypt releases the GIL while hashing, so a small thread pool keeps
+    the event loop responsive and still uses several cores. The number
+    of hashing jobs running or waiting is capped; beyond the cap new
+    jobs are rejected instead of queuing without limit.
+    """
+
+    def __init__(self, workers: int, queue_limit: int):
+        """
+        Initialize the pool.
+
+        Args:
+            workers (int): Number of hashing threads.
+            queue_limit (int): Maximum number of jobs running or waiting.
+        """
+        self.queue_limit = queue_limit
+        self.pending = 0
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hash"
+        )
+
+    async def run(self, func: Callable[..., Any], *args) -> Any:
+        """
+        Run a blocking hashing function on the pool.
+
+        Args:
+            func (Callable): Function to run.
+            *args: Arguments of the function.
+
+        Returns:
+            The result of the function.
+
+        Raises:
+            HTTPException: If too many hashing jobs are already pending.
+        """
+        if self.pending >= self.queue_limit:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many password checks in progress, "
+                "try again later.",
+                headers={"Retry-After": "1"},
+            )
+        self.pending += 1
+        try:
+            job = self.executor.submit(func, *args)
+        except BaseException:
+            self.pending -= 1
+            raise
+        # The slot is freed when the job ends, not when the caller stops
+        # waiting: a cancelled request leaves its job running
+        loop = asyncio.get_running_loop()
+        job.add_done_callback(
+            lambda _: loop.call_soon_threadsafe(self._release)
+        )
+        return await asyncio.wrap_future(job)
+
+    def _release(self):
+        """
+        Free the slot of a finished or cancelled hashing job.
+        """
+        self.pending -= 1
+
+    def shutdown(self):
+        """
+        Stop the hashing threads once the running jobs have finished.
+        """
+        self.executor.shutdown(wait=True)
+
+
+hashing_pool = HashingPool(settings.HASH_POOL_SIZE, settings.HASH_QUEUE_LIMIT)
@@ -0,0 +1,105 @@
+import hashlib
+import json
+import secrets
+
+from fastapi import HTTPException, status
+
+from src.conf.config import settings
+from src.database.models import User
+from src.services.redis_cache import redis_cache
+
+
+def request_fingerprint(method: str, path: str, payload) -> str:
+    """
+    Hash what a request asks for, to tell retries from key reuse.
+
+    :param method: HTTP method.
+    :param path: Request path.
+    :param payload: JSON-serializable request body.
+    :return: SHA-256 hex digest.
+    """
+    return hashlib.sha256(
+        json.dumps([method, path, payload], sort_keys=True, default=str)
+        .encode()
+    ).hexdigest()
+
+
+class IdempotencyStore:
+    """
+    Responses of mutations sent with an `Idempotency-Key` header.
+
+    The first request with a key takes a short lock, runs and stores its
+    status and body for `IDEMPOTENCY_TTL` seconds. Retries with the same
+    key replay the stored response without touching the database.
+    """
+
+    def __init__(self, user: User, key: str):
+        """
+        Scope the store to one key of one user.
+
+        :param user: Current authenticated user.
+        :param key: Value of the `Idempotency-Key` header.
+        """
+        self.key = f"idempotency:{user.id}:{key}"
+        self.lock_key = f"{self.key}:lock"
+        self.lock_value = {"token": secrets.token_hex(16)}
+
+    async def replay(self, fingerprint: str) -> dict | None:
+        """
+        Retrieve the stored response of the key.
+
+        :param fingerprint: Fingerprint of the current request.
+        :return: Stored `status` and `body`, or None if there is none.
+        :raises HTTPException: If the key was used for another request.
+        """
+        stored = await redis_cache.get(self.key)
+        if stored is None:
+            return None
+        if stored["fingerprint"] != fingerprint:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Idempotency-Key was already used for "
+                "a different request",
+            )
+        return stored
+
+    async def lock(self):
+        """
+        Mark the key as being processed.
+
+        :raises HTTPException: If another request with the key is still
+        in flight.
+        """
+        locked = await redis_cache.add(
+            self.lock_key, self.lock_value,
+            expire=settings.IDEMPOTENCY_LOCK_TTL,
+        )
+        if not locked:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="A request with this Idempotency-Key "
+                "is still in progress",
+            )
+
+    async def unlock(self):
+        """
+        Release the key, whether or not a response was stored.
+
+        A request that outlived `IDEMPOTENCY_LOCK_TTL` may have lost the
+        lock to a retry; the retry's lock is left in place.
+        """
+        await redis_cache.delete_if_equals(self.lock_key, self.lock_value)
+
+    async def save(self, fingerprint: str, status_code: int, body):
+        """
+        Store the response of the key.
+
+        :param fingerprint: Fingerprint of the request.
+        :param status_code: HTTP status of the response.
+        :param body: JSON-ready response body.
+        """
+        await redis_cache.set(
+            self.key,
+            {"fingerprint": fingerprint, "status": status_code, "body": body},
+            expire=settings.IDEMPOTENCY_TTL,
+        )
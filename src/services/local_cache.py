@@ -0,0 +1,82 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class LocalCache:
+    """
+    In-process cache with a time to live and least-recently-used eviction.
+
+    Every worker process keeps its own copy, so reads need neither I/O
+    nor deserialization. Entries may outlive a change made by another
+    worker by up to `ttl` seconds unless they are evicted explicitly.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize (int): Maximum number of entries.
+            ttl (float): Seconds an entry stays valid.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return a cached value and mark it as recently used.
+
+        Args:
+            key (Hashable): Cache key.
+            default (Any): Value returned for missing or expired entries.
+
+        Returns:
+            Any: The cached value or `default`.
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            return default
+        if entry[0] <= time.monotonic():
+            del self.entries[key]
+            return default
+        self.entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None):
+        """
+        Store a value, evicting the least recently used entry when full.
+
+        Args:
+            key (Hashable): Cache key.
+            value (Any): Value to store.
+            ttl (float | None): Seconds the entry stays valid, defaults
+                to the TTL of the cache.
+        """
+        if self.maxsize <= 0:
+            return
+        if ttl is None:
+            ttl = self.ttl
+        self.entries[key] = (time.monotonic() + ttl, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def pop(self, key: Hashable):
+        """
+        Remove an entry if it is cached.
+
+        Args:
+            key (Hashable): Cache key.
+        """
+        self.entries.pop(key, None)
+
+    def clear(self):
+        """
+        Remove all entries.
+        """
+        self.entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.entries)
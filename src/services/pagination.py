@@ -0,0 +1,46 @@
+import base64
+import binascii
+import json
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(*values) -> str:
+    """
+    Encode the keyset position of the last returned row into an opaque token.
+
+    Args:
+        *values: Sort key values of the last row, ending with its ID.
+
+    Returns:
+        str: URL-safe cursor token.
+    """
+    raw = json.dumps(list(values), separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, size: int) -> tuple:
+    """
+    Decode a cursor token produced by `encode_cursor`.
+
+    Args:
+        token (str): Cursor token received from the client.
+        size (int): Expected number of values in the cursor.
+
+    Returns:
+        tuple: Decoded keyset values.
+
+    Raises:
+        HTTPException: If the token is malformed.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        values = None
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+    return tuple(values)
@@ -1,7 +1,67 @@
+import time
+from collections import defaultdict
+from typing import AsyncIterator
+
 import redis.asyncio as redis
 import json
 from src.conf.config import settings
 
+
+# Зберігає значення (SET NX), лише якщо лічильник версії не змінився:
+# значення, обчислене до конкурентного запису, не потрапляє в кеш
+SET_IF_VERSION = """
+if redis.call('GET', KEYS[2]) == ARGV[2] then
+    return redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[3], 'NX')
+end
+return nil
+"""
+
+# Видаляє ключ, лише якщо він досі містить очікуване значення,
+# щоб не зняти блокування, яке вже встановив інший запит
+DELETE_IF_EQUALS = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class CacheStats:
+    """
+    Лічильники влучань і промахів кешів у межах одного воркера.
+    """
+
+    def __init__(self):
+        self.hits = defaultdict(int)
+        self.misses = defaultdict(int)
+
+    def hit(self, name: str):
+        """
+        Рахує влучання в кеш з назвою `name`.
+        """
+        self.hits[name] += 1
+
+    def miss(self, name: str):
+        """
+        Рахує промах кешу з назвою `name`.
+        """
+        self.misses[name] += 1
+
+    def snapshot(self) -> dict:
+        """
+        Повертає лічильники та частку влучань для кожного кешу.
+        """
+        stats = {}
+        for name in sorted(set(self.hits) | set(self.misses)):
+            hits, misses = self.hits[name], self.misses[name]
+            stats[name] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": round(hits / (hits + misses), 4),
+            }
+        return stats
+
+
 class RedisCache:
     def __init__(self):
         self.redis = None
@@ -29,6 +89,55 @@ class RedisCache:
                 return json.loads(data)
         return None
 
+    async def get_many(self, keys: list[str]) -> list:
+        """
+        Отримує значення кількох ключів одним запитом MGET.
+
+        Для відсутніх ключів (або без Redis) повертає None.
+        """
+        if not self.redis or not keys:
+            return [None] * len(keys)
+        return [
+            json.loads(data) if data else None
+            for data in await self.redis.mget(keys)
+        ]
+
+    async def set_many(self, values: dict, expire: int = 3600):
+        """
+        Зберігає кілька значень одним конвеєром (pipeline) Redis.
+        """
+        if self.redis and values:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, value in values.items():
+                    pipe.set(key, json.dumps(value), ex=expire)
+                await pipe.execute()
+
+    async def add(self, key: str, value: dict, expire: int) -> bool:
+        """
+        Зберігає значення, лише якщо ключа ще немає (SET NX).
+
+        Без Redis завжди повертає True.
+        """
+        if not self.redis:
+            return True
+        return bool(
+            await self.redis.set(key, json.dumps(value), ex=expire, nx=True)
+        )
+
+    async def add_if_version(
+        self, key: str, value, version_key: str, version: int | None,
+        expire: int,
+    ):
+        """
+        Зберігає значення (SET NX), якщо версія за ключем `version_key`
+        досі дорівнює `version`, прочитаній до обчислення значення.
+        """
+        if self.redis and version is not None:
+            await self.redis.eval(
+                SET_IF_VERSION, 2, key, version_key,
+                json.dumps(value), version, expire,
+            )
+
     async def delete(self, key: str):
         """
         Видаляє значення з Redis.
@@ -36,4 +145,93 @@ class RedisCache:
         if self.redis:
             await self.redis.delete(key)
 
+    async def delete_if_equals(self, key: str, value: dict):
+        """
+        Атомарно видаляє ключ, якщо він зберігає саме значення `value`.
+        """
+        if self.redis:
+            await self.redis.eval(DELETE_IF_EQUALS, 1, key, json.dumps(value))
+
+    async def get_version(self, key: str) -> int | None:
+        """
+        Повертає лічильник версії за ключем, створюючи його за потреби.
+
+        Новий лічильник починається з поточного часу в наносекундах, тому
+        версія не повторюється, навіть якщо ключ було витіснено з Redis.
+        """
+        if not self.redis:
+            return None
+        version = await self.redis.get(key)
+        if version is None:
+            await self.redis.set(key, time.time_ns(), nx=True)
+            version = await self.redis.get(key)
+        return int(version)
+
+    async def bump_version(self, key: str):
+        """
+        Збільшує лічильник версії, що інвалідує всі залежні записи кешу.
+        """
+        if self.redis:
+            await self.get_version(key)
+            await self.redis.incr(key)
+
+    async def publish(self, channel: str, message: dict):
+        """
+        Публікує повідомлення в канал Redis pub/sub.
+
+        Повідомлення отримують підписники на всіх воркерах і вузлах.
+        """
+        if self.redis:
+            await self.redis.publish(channel, json.dumps(message))
+
+    async def subscribe(
+        self, channel: str, timeout: float
+    ) -> AsyncIterator[dict | None]:
+        """
+        Підписується на канал Redis pub/sub і віддає його повідомлення.
+
+        Кожен підписник використовує окреме з'єднання. Якщо за `timeout`
+        секунд нічого не надійшло, віддає None, щоб викликач міг
+        надіслати keep-alive.
+        """
+        pubsub = self.redis.pubsub()
+        await pubsub.subscribe(channel)
+        try:
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=timeout
+                )
+                yield json.loads(message["data"]) if message else None
+        finally:
+            await pubsub.unsubscribe(channel)
+            await pubsub.aclose()
+
+    async def psubscribe(
+        self, pattern: str, timeout: float
+    ) -> AsyncIterator[tuple[str, dict]]:
+        """
+        Підписується на всі канали, що відповідають шаблону `pattern`,
+        і віддає пари (канал, повідомлення).
+
+        Одне з'єднання обслуговує всі канали шаблону, тому кількість
+        з'єднань не залежить від кількості слухачів.
+        """
+        pubsub = self.redis.pubsub()
+        await pubsub.psubscribe(pattern)
+        try:
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=timeout
+                )
+                if message:
+                    yield (
+                        message["channel"].decode(),
+                        json.loads(message["data"]),
+                    )
+        finally:
+            await pubsub.punsubscribe(pattern)
+            await pubsub.aclose()
+
+
 redis_cache = RedisCache()
+cache_stats = CacheStats()
@@ -0,0 +1,159 @@
+import asyncio
+import logging
+import random
+
+from redis.exceptions import RedisError
+
+from src.conf.config import settings
+from src.schemas.users import UserCacheModel
+from src.services.local_cache import LocalCache
+from src.services.redis_cache import cache_stats, redis_cache
+
+# Pub/sub channel announcing users whose cached entries are stale
+USER_EVENTS_CHANNEL = "users:invalidate"
+
+local_users = LocalCache(
+    settings.USER_LOCAL_CACHE_SIZE, settings.USER_LOCAL_CACHE_TTL
+)
+
+
+def user_ttl() -> int:
+    """
+    Pick the Redis TTL of a cached user.
+
+    Returns:
+        int: `USER_CACHE_TTL` randomly spread by `USER_CACHE_TTL_JITTER`.
+    """
+    jitter = settings.USER_CACHE_TTL_JITTER
+    return round(settings.USER_CACHE_TTL * random.uniform(1 - jitter,
+                                                          1 + jitter))
+
+
+def user_key(username: str) -> str:
+    """
+    Build the Redis key of a cached user.
+
+    Args:
+        username (str): Username of the user.
+
+    Returns:
+        str: Redis key.
+    """
+    return f"user:{username}"
+
+
+async def get_cached_user(username: str) -> UserCacheModel | None:
+    """
+    Look a user up in the worker's memory, then in Redis.
+
+    A Redis hit is copied into the in-process tier, so the following
+    requests of the user need no round trip.
+
+    Args:
+        username (str): Username of the user.
+
+    Returns:
+        UserCacheModel | None: Cached user, or None on a miss in both tiers.
+    """
+    user = local_users.get(username)
+    if user is not None:
+        cache_stats.hit("user:local")
+        return user
+    cache_stats.miss("user:local")
+
+    data = await redis_cache.get(user_key(username))
+    if data is None:
+        cache_stats.miss("user:redis")
+        return None
+    cache_stats.hit("user:redis")
+    user = UserCacheModel(**data)
+    local_users.set(username, user)
+    return user
+
+
+async def cache_user(user) -> UserCacheModel:
+    """
+    Fill both cache tiers with a user loaded after a cache miss.
+
+    The entry is only added if Redis has none (SET NX): a request that
+    read the user just before a change committed must not overwrite the
+    entry written through by `refresh_user`.
+
+    Args:
+        user: User model or any object with the cached user fields.
+
+    Returns:
+        UserCacheModel: The cached representation of the user.
+    """
+    cached = UserCacheModel.model_validate(user)
+    if await redis_cache.add(user_key(cached.username), cached.model_dump(),
+                             expire=user_ttl()):
+        local_users.set(cached.username, cached)
+    return cached
+
+
+async def refresh_user(user):
+    """
+    Write a changed user through to the caches.
+
+    Called after the change is committed. Redis gets the new entry and
+    the other workers drop their copies, re-reading it from Redis on
+    the next request. If Redis cannot be updated the user is evicted
+    instead. Redis failures are logged rather than raised, because the
+    change itself has already been applied.
+
+    Args:
+        user: Committed user model.
+    """
+    try:
+        cached = UserCacheModel.model_validate(user)
+        await redis_cache.set(user_key(cached.username),
+                              cached.model_dump(), expire=user_ttl())
+        local_users.set(cached.username, cached)
+        await redis_cache.publish(USER_EVENTS_CHANNEL,
+                                  {"username": user.username})
+    except RedisError as e:
+        logging.error(f"Failed to update cached user {user.username}: {e}")
+        local_users.pop(user.username)
+        try:
+            await invalidate_user(user.username)
+        except RedisError as e:
+            logging.error(
+                f"Failed to evict cached user {user.username}: {e}"
+            )
+
+
+async def invalidate_user(username: str):
+    """
+    Drop a user from Redis and from the memory of every worker.
+
+    Args:
+        username (str): Username of the changed user.
+    """
+    local_users.pop(username)
+    await redis_cache.delete(user_key(username))
+    await redis_cache.publish(USER_EVENTS_CHANNEL, {"username": username})
+
+
+async def listen_user_invalidations():
+    """
+    Evict users announced on the invalidation channel from this worker.
+
+    The publishing worker receives its own messages too; evicting its
+    fresh entry only costs one Redis read.
+
+    Runs for the lifetime of the worker. While the subscription is down
+    messages may be lost, so the in-process tier is cleared whenever it
+    is re-established.
+    """
+    while True:
+        try:
+            async for message in redis_cache.subscribe(
+                USER_EVENTS_CHANNEL, timeout=60
+            ):
+                if message is not None:
+                    local_users.pop(message["username"])
+        except RedisError as e:
+            logging.error(f"User invalidation subscription lost: {e}")
+            local_users.clear()
+            await asyncio.sleep(1)
@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.repository.user import UserRepository
 from src.schemas.users import UserCreate
+from src.services.user_cache import refresh_user
 
 
 class UserService:
@@ -32,7 +33,9 @@ class UserService:
         except Exception as e:
             print(f"Gravatar fetch error: {e}")
 
-        return await self.repository.create_user(body, avatar)
+        user = await self.repository.create_user(body, avatar)
+        await refresh_user(user)
+        return user
 
     async def get_user_by_id(self, user_id: int):
         """
@@ -63,22 +66,25 @@ class UserService:
 
     async def confirmed_email(self, email: str):
         """
-         Mark a user's email as verified.
+         Mark a user's email as verified and update the cached user.
 
          :param email: Email address of the user.
          :return: None.
         """
-        return await self.repository.confirmed_email(email)
+        user = await self.repository.confirmed_email(email)
+        await refresh_user(user)
 
     async def update_avatar_url(self, email: str, url: str):
         """
-        Update the avatar URL for a user.
+        Update the avatar URL for a user and the cached user.
 
         :param email: Email address of the user.
         :param url: New avatar URL.
         :return: Updated user object.
         """
-        return await self.repository.update_avatar_url(email, url)
+        user = await self.repository.update_avatar_url(email, url)
+        await refresh_user(user)
+        return user
 
     async def reset_password(self, user_id: int, password: str):
         """
@@ -91,5 +97,8 @@ class UserService:
         Повертає:
             User: Оновлений користувач.
         """
-        # Скидання пароля користувача
-        return await self.repository.reset_password(user_id, password)
+        # Скидання пароля користувача та оновлення його в кешах
+        user = await self.repository.reset_password(user_id, password)
+        if user:
+            await refresh_user(user)
+        return user
@@ -0,0 +1,59 @@
+from unittest.mock import Mock
+
+import pytest
+from jose import JWTError, jwt
+
+from src.services import auth
+from src.services.local_cache import LocalCache
+
+
+@pytest.fixture
+def counted_decode(monkeypatch):
+    monkeypatch.setattr(auth, "_verified_tokens", LocalCache(10, 0))
+    decode = Mock(wraps=jwt.decode)
+    monkeypatch.setattr(auth.jwt, "decode", decode)
+    return decode
+
+
+@pytest.mark.asyncio
+async def test_decode_access_token_is_memoized(counted_decode):
+    """Тест повторного використання перевіреного токена."""
+    token = await auth.create_access_token(data={"sub": "alice"})
+
+    first = auth.decode_access_token(token)
+    second = auth.decode_access_token(token)
+
+    assert first["sub"] == second["sub"] == "alice"
+    assert counted_decode.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_decode_access_token_kill_switch(counted_decode, monkeypatch):
+    """Тест вимкнення кешу перевірених токенів."""
+    monkeypatch.setattr(auth.settings, "AUTH_TOKEN_CACHE", False)
+    token = await auth.create_access_token(data={"sub": "alice"})
+
+    auth.decode_access_token(token)
+    auth.decode_access_token(token)
+
+    assert counted_decode.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_decode_access_token_forgets_expired_tokens(
+    counted_decode, monkeypatch
+):
+    """Тест повторної перевірки токена після завершення його терміну."""
+    now = [1000.0]
+    monkeypatch.setattr("src.services.local_cache.time.monotonic",
+                        lambda: now[0])
+    token = await auth.create_access_token(data={"sub": "alice"},
+                                           expires_delta=60)
+    auth.decode_access_token(token)
+
+    now[0] += 61
+    counted_decode.side_effect = JWTError("Signature has expired.")
+
+    with pytest.raises(JWTError):
+        auth.decode_access_token(token)
+    assert counted_decode.call_count == 2
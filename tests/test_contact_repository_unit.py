@@ -3,8 +3,8 @@ from unittest.mock import AsyncMock, MagicMock
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import Contact, User
-from src.repository.contacts import ContactRepository
-from src.schemas.contacts import ContactModel
+from src.repository.contacts import ContactRepository, derived_columns
+from src.schemas.contacts import ContactModel, ContactUpdate
 
 
 @pytest.fixture
@@ -36,6 +36,12 @@ async def test_create_contact(contact_repository, mock_session, user):
         birthday="1990-01-01"
     )
 
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = Contact(
+        id=1, **contact_data.model_dump(), user_id=user.id
+    )
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
     # Викликаємо метод створення контакту
     result = await contact_repository.create_contact(body=contact_data,
                                                      user=user)
@@ -47,10 +53,55 @@ async def test_create_contact(contact_repository, mock_session, user):
     assert result.email == "john.doe@example.com"
     assert result.phone == "+380501234567"
 
-    # Перевірка викликів методів сесії
-    mock_session.add.assert_called_once()
+    # Один запит INSERT ... ON CONFLICT DO NOTHING RETURNING
+    mock_session.execute.assert_awaited_once()
+    mock_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_create_contact_conflict(contact_repository, mock_session,
+                                       user):
+    """Тест створення контакту, який вже існує."""
+    contact_data = ContactModel(
+        name="John",
+        surname="Doe",
+        email="john.doe@example.com",
+        phone="+380501234567",
+        birthday="1990-01-01"
+    )
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = None
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    result = await contact_repository.create_contact(body=contact_data,
+                                                     user=user)
+
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_create_contacts(contact_repository, mock_session, user):
+    """Тест масового створення контактів одним запитом."""
+    contact_data = ContactModel(
+        name="John",
+        surname="Doe",
+        email="john.doe@example.com",
+        phone="+380501234567",
+        birthday="1990-01-01"
+    )
+    mock_result = MagicMock()
+    mock_result.all.return_value = [
+        (1, "john.doe@example.com", "+380501234567")
+    ]
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    created = await contact_repository.create_contacts(
+        bodies=[contact_data], user=user
+    )
+
+    assert created == [(1, "john.doe@example.com", "+380501234567")]
+    mock_session.execute.assert_awaited_once()
     mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(result)
 
 
 @pytest.mark.asyncio
@@ -100,11 +151,10 @@ async def test_update_contact(contact_repository, mock_session, user):
         name="Jane", surname="Doe", email="jane.doe@example.com",
         phone="+380501234567", birthday="1990-01-01"
     )
-    existing_contact = Contact(id=1, name="Old Name", surname="Old Surname",
-                               email="old@example.com", user=user)
+    updated = Contact(id=1, **contact_data.model_dump(), user=user)
 
     mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = existing_contact
+    mock_result.scalar_one_or_none.return_value = updated
     mock_session.execute = AsyncMock(return_value=mock_result)
 
     updated_contact = await contact_repository.update_contact(contact_id=1,
@@ -116,8 +166,27 @@ async def test_update_contact(contact_repository, mock_session, user):
     assert updated_contact.surname == "Doe"
     assert updated_contact.email == "jane.doe@example.com"
 
+    # Один запит UPDATE ... RETURNING без додаткового SELECT
+    mock_session.execute.assert_awaited_once()
     mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(existing_contact)
+    mock_session.refresh.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_partial_update_without_changes(contact_repository,
+                                              mock_session, user):
+    """Тест часткового оновлення без змінених полів."""
+    existing_contact = Contact(id=1, name="John", user=user)
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = existing_contact
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    contact = await contact_repository.update_contact(
+        contact_id=1, body=ContactUpdate(), user=user, partial=True
+    )
+
+    assert contact is existing_contact
+    mock_session.commit.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -137,7 +206,12 @@ async def test_remove_contact(contact_repository, mock_session, user):
     assert deleted_contact.name == "To Delete"
     assert deleted_contact.email == "delete@example.com"
 
-    mock_session.delete.assert_awaited_once_with(existing_contact)
+    # Один запит DELETE ... RETURNING і надгробок для стрічки змін
+    mock_session.execute.assert_awaited_once()
+    mock_session.delete.assert_not_awaited()
+    tombstone = mock_session.add.call_args.args[0]
+    assert tombstone.contact_id == 1
+    assert tombstone.user_id == user.id
     mock_session.commit.assert_awaited_once()
 
 
@@ -158,3 +232,17 @@ async def test_get_upcoming_birthdays(contact_repository, mock_session, user):
     assert contacts[0].name == "John"
     assert contacts[0].surname == "Doe"
     assert contacts[0].email == "john.doe@example.com"
+
+
+def test_derived_columns():
+    """Тест нормалізації телефону та email для точного пошуку."""
+    derived = derived_columns({
+        "phone": "+380 (50) 123-45-67",
+        "email": " John.Doe@Example.com",
+    })
+
+    assert derived == {
+        "phone_digits": "380501234567",
+        "email_lower": "john.doe@example.com",
+    }
+    assert derived_columns({"info": "no source fields"}) == {}
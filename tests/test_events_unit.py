@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+from src.services import events
+from src.services.events import EventHub
+
+
+@pytest.fixture
+def published(monkeypatch):
+    messages = []
+
+    async def psubscribe(pattern, timeout):
+        assert pattern == "contacts:events:*"
+        for message in messages:
+            yield message
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(events.redis_cache, "psubscribe", psubscribe)
+    return messages
+
+
+@pytest.mark.asyncio
+async def test_hub_fans_out_by_channel(published):
+    """Тест доставки повідомлень лише підписникам їхнього каналу."""
+    published.extend([
+        ("contacts:events:2", {"type": "deleted"}),
+        ("contacts:events:1", {"type": "updated"}),
+    ])
+    hub = EventHub("contacts:events:*", queue_size=10)
+    first = hub.subscribe("contacts:events:1", timeout=0.05)
+    second = hub.subscribe("contacts:events:1", timeout=0.05)
+
+    assert await asyncio.gather(anext(first), anext(second)) == [
+        {"type": "updated"}, {"type": "updated"}
+    ]
+    assert await anext(first) is None
+
+    await first.aclose()
+    await second.aclose()
+    assert not hub.queues
+    hub.close()
+
+
+@pytest.mark.asyncio
+async def test_hub_disconnects_slow_subscriber():
+    """Тест відключення підписника, що надто відстав."""
+    hub = EventHub("contacts:events:*", queue_size=1)
+    hub.listener = asyncio.get_running_loop().create_future()
+    stream = hub.subscribe("contacts:events:1", timeout=1)
+    waiting = asyncio.ensure_future(anext(stream))
+    await asyncio.sleep(0)
+
+    hub.dispatch("contacts:events:1", {"type": "created"})
+    assert await waiting == {"type": "created"}
+    hub.dispatch("contacts:events:1", {"type": "updated"})
+    hub.dispatch("contacts:events:1", {"type": "deleted"})
+
+    with pytest.raises(StopAsyncIteration):
+        await anext(stream)
+    assert not hub.queues
@@ -0,0 +1,62 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from src.services.auth import Hash
+from src.services.hashing import HashingPool
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_async():
+    """Тест хешування та перевірки пароля в пулі потоків."""
+    hashed = await Hash().get_password_hash_async("secret123")
+
+    assert await Hash().verify_password_async("secret123", hashed)
+    assert not await Hash().verify_password_async("wrong", hashed)
+
+
+@pytest.mark.asyncio
+async def test_pool_rejects_jobs_over_queue_limit():
+    """Тест відмови, коли черга хешування заповнена."""
+    pool = HashingPool(workers=1, queue_limit=1)
+    release = threading.Event()
+    running = asyncio.ensure_future(pool.run(release.wait))
+    await asyncio.sleep(0)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await pool.run(lambda: None)
+    assert exc_info.value.status_code == 503
+
+    release.set()
+    assert await running is True
+    assert pool.pending == 0
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_keeps_slot_until_job_ends():
+    """Тест: скасований запит не звільняє місце, поки хеш обчислюється."""
+    pool = HashingPool(workers=1, queue_limit=1)
+    started = threading.Event()
+    release = threading.Event()
+
+    def job():
+        started.set()
+        release.wait()
+
+    caller = asyncio.ensure_future(pool.run(job))
+    await asyncio.get_running_loop().run_in_executor(None, started.wait)
+    caller.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+
+    assert pool.pending == 1
+    with pytest.raises(HTTPException):
+        await pool.run(lambda: None)
+
+    release.set()
+    pool.shutdown()
+    await asyncio.sleep(0)
+    assert pool.pending == 0
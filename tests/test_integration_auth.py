@@ -1,10 +1,13 @@
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 from fastapi import status
 from fastapi.testclient import TestClient
+from jose import jwt
 import pytest
 from sqlalchemy import select
 
+from src.conf.config import settings
 from src.database.models import User
+from src.services.local_cache import LocalCache
 from tests.conftest import TestingSessionLocal
 
 
@@ -60,6 +63,57 @@ async def test_login(client):
     assert "token_type" in data
     assert data["token_type"] == "bearer", f'Token type should be {data["token_type"]}'
 
+def login_token(client):
+    response = client.post("api/auth/login",
+                           json={"email": user_data.get("email"),
+                                 "password": user_data.get("password")})
+    assert response.status_code == status.HTTP_200_OK, response.text
+    return response.json()["access_token"]
+
+def test_login_token_carries_user_claims(client):
+    payload = jwt.get_unverified_claims(login_token(client))
+    assert payload["sub"] == user_data["username"]
+    assert isinstance(payload["uid"], int)
+    assert payload["email"] == user_data["email"]
+    assert payload["role"] == "user"
+    assert payload["verified"] is True
+    assert "iat" in payload
+
+def test_stateless_principal_skips_user_lookup(client, monkeypatch):
+    token = login_token(client)
+    monkeypatch.setattr(settings, "AUTH_STATELESS", True)
+    monkeypatch.setattr(
+        "src.services.auth.UserService.get_user_by_username",
+        AsyncMock(side_effect=AssertionError("user must not be loaded")),
+    )
+    response = client.get("api/contacts",
+                          headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+def test_stateless_principal_revoked_token(client, monkeypatch):
+    token = login_token(client)
+    monkeypatch.setattr(settings, "AUTH_STATELESS", True)
+    monkeypatch.setattr("src.services.auth._token_versions",
+                        LocalCache(10, 60))
+    monkeypatch.setattr("src.services.auth.redis_cache.get_version",
+                        AsyncMock(return_value=5))
+    response = client.get("api/contacts",
+                          headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED, response.text
+
+def test_stateless_principal_token_after_revocation(client, monkeypatch):
+    """A token issued right after a revocation must stay valid."""
+    monkeypatch.setattr(settings, "AUTH_STATELESS", True)
+    monkeypatch.setattr("src.services.auth._token_versions",
+                        LocalCache(10, 60))
+    monkeypatch.setattr("src.services.auth.redis_cache.get_version",
+                        AsyncMock(return_value=5))
+    token = login_token(client)
+    assert jwt.get_unverified_claims(token)["tv"] == 5
+    response = client.get("api/contacts",
+                          headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == status.HTTP_200_OK, response.text
+
 def test_wrong_password_login(client):
     response = client.post("api/auth/login",
                            json={"email": user_data.get("email"), "password": "password"})
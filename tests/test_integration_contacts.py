@@ -1,5 +1,17 @@
+import csv
+import io
+import json
+from datetime import date, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
 from fastapi import status
 
+from src.conf.config import settings
+from src.database.models import User
+from src.services.idempotency import IdempotencyStore, request_fingerprint
+from src.services.pagination import encode_cursor
+
 test_contact = {
     "name": "Johnny",
     "surname": "Doe",
@@ -46,6 +58,15 @@ def test_create_contact(client, get_token):
     assert "created_at" in data
     assert "updated_at" in data
 
+def test_create_contact_duplicate(client, get_token):
+    response = client.post(
+        "/api/contacts",
+        json=test_contact,
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+    assert "already exists" in response.json()["detail"]
+
 def test_get_contact(client, get_token):
     response = client.get(
         "/api/contacts/1", headers={"Authorization": f"Bearer {get_token}"}
@@ -55,6 +76,36 @@ def test_get_contact(client, get_token):
     assert data["name"] == test_contact["name"]
     assert "id" in data
 
+def test_get_contact_not_modified(client, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+    response = client.get("/api/contacts/1", headers=headers)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    etag = response.headers["ETag"]
+
+    response = client.get(
+        "/api/contacts/1", headers={**headers, "If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+
+def test_get_contacts_not_modified_by_version(client, get_token,
+                                              monkeypatch):
+    headers = {"Authorization": f"Bearer {get_token}"}
+    monkeypatch.setattr("src.services.contacts.redis_cache.get_version",
+                        AsyncMock(return_value=7))
+    response = client.get("/api/contacts", headers=headers)
+    etag = response.headers["ETag"]
+
+    load = AsyncMock()
+    monkeypatch.setattr(
+        "src.services.contacts.ContactService.get_contacts", load
+    )
+    response = client.get(
+        "/api/contacts", headers={**headers, "If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    load.assert_not_awaited()
+
 def test_get_contact_not_found(client, get_token):
     response = client.get(
         "/api/contacts/2", headers={"Authorization": f"Bearer {get_token}"}
@@ -71,6 +122,480 @@ def test_get_contacts(client, get_token):
     assert data[0]["name"] == contacts[0]["name"]
     assert "id" in data[0]
 
+def test_suggest_contacts(client, get_token):
+    response = client.get(
+        "/api/contacts/suggest?prefix=johnny%20d&limit=5",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json() == [{"id": 1, "display_name": "Johnny Doe"}]
+
+def test_suggest_contacts_no_match(client, get_token):
+    response = client.get(
+        "/api/contacts/suggest?prefix=zz",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json() == []
+
+def test_lookup_contact_by_phone(client, get_token):
+    phone = contacts[0]["phone"]
+    formatted = f"{phone[:4]} ({phone[4:6]}) {phone[6:9]}-{phone[9:]}"
+    response = client.get(
+        "/api/contacts/lookup",
+        params={"phone": formatted},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert [contact["id"] for contact in response.json()] == [1]
+
+def test_lookup_contact_by_email(client, get_token):
+    response = client.get(
+        "/api/contacts/lookup",
+        params={"email": contacts[0]["email"].upper()},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert [contact["id"] for contact in response.json()] == [1]
+
+def test_lookup_contact_requires_phone_or_email(client, get_token):
+    response = client.get(
+        "/api/contacts/lookup",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+
+def test_get_contacts_batch(client, get_token):
+    response = client.get(
+        "/api/contacts/batch?ids=1,999,1",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    data = response.json()
+    assert [contact["id"] for contact in data["contacts"]] == [1]
+    assert data["contacts"][0]["email"] == contacts[0]["email"]
+    assert data["missing"] == [999]
+
+def test_get_contacts_batch_from_cache(client, get_token, monkeypatch):
+    from src.services.redis_cache import redis_cache
+
+    cached = {"id": 1, "name": "Cached"}
+    monkeypatch.setattr(redis_cache, "get_version", AsyncMock(return_value=7))
+    monkeypatch.setattr(
+        redis_cache, "get_many", AsyncMock(return_value=[cached, None])
+    )
+    set_many = AsyncMock()
+    monkeypatch.setattr(redis_cache, "set_many", set_many)
+    response = client.get(
+        "/api/contacts/batch?ids=1,999",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json() == {"contacts": [cached], "missing": [999]}
+    set_many.assert_not_awaited()
+
+def test_get_contacts_batch_invalid_ids(client, get_token):
+    response = client.get(
+        "/api/contacts/batch?ids=1,abc",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+
+def test_get_contacts_from_cache(client, get_token, monkeypatch):
+    cached = [{**contacts[1], "id": 42}]
+    monkeypatch.setattr("src.services.contacts.redis_cache.get_version",
+                        AsyncMock(return_value=7))
+    monkeypatch.setattr(
+        "src.services.contacts.redis_cache.get",
+        AsyncMock(side_effect=lambda key: (
+            cached if key.startswith("contacts:") else None
+        )),
+    )
+    response = client.get(
+        "/api/contacts", headers={"Authorization": f"Bearer {get_token}"}
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json()[0]["id"] == 42
+
+def test_get_contacts_cursor_pagination(client, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+    response = client.post(
+        "/api/contacts",
+        json={key: contacts[1][key] for key in test_contact},
+        headers=headers,
+    )
+    assert response.status_code == status.HTTP_201_CREATED, response.text
+
+    response = client.get("/api/contacts?limit=1", headers=headers)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json()[0]["name"] == contacts[0]["name"]
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = client.get(
+        f"/api/contacts?limit=1&cursor={cursor}", headers=headers
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    data = response.json()
+    assert len(data) == 1
+    assert data[0]["name"] == contacts[1]["name"]
+
+def test_get_contacts_sorted_cursor_pagination(client, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+    response = client.get(
+        "/api/contacts?sort=name&order=desc&limit=1", headers=headers
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json()[0]["name"] == contacts[1]["name"]
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = client.get(
+        f"/api/contacts?sort=name&order=desc&limit=1&cursor={cursor}",
+        headers=headers,
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json()[0]["name"] == contacts[0]["name"]
+
+def test_get_contacts_sorted_by_birthday(client, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+    response = client.get(
+        "/api/contacts?sort=birthday&limit=1&fields=name", headers=headers
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json() == [{
+        "id": 1, "birthday": contacts[0]["birthday"],
+        "name": contacts[0]["name"],
+    }]
+
+    response = client.get(
+        "/api/contacts?sort=birthday&limit=1&fields=name"
+        f"&cursor={response.headers['X-Next-Cursor']}",
+        headers=headers,
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json()[0]["birthday"] == contacts[1]["birthday"]
+
+def test_get_contacts_total_count(client, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+    total = len(client.get("/api/contacts?limit=1000", headers=headers).json())
+
+    response = client.get("/api/contacts?limit=1&count=true", headers=headers)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.headers["X-Total-Count"] == str(total)
+    assert "X-Total-Count-Estimated" not in response.headers
+
+    response = client.get(
+        "/api/contacts?limit=1&count=true&name=Kate", headers=headers
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.headers["X-Total-Count"] == "1"
+
+def test_get_contacts_count_stored_for_version(client, get_token,
+                                               monkeypatch):
+    from src.services.redis_cache import redis_cache
+
+    monkeypatch.setattr(redis_cache, "get_version", AsyncMock(return_value=7))
+    add_if_version = AsyncMock()
+    monkeypatch.setattr(redis_cache, "add_if_version", add_if_version)
+    response = client.get(
+        "/api/contacts?limit=1&count=true",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    add_if_version.assert_awaited_once_with(
+        "contacts:count:1", int(response.headers["X-Total-Count"]),
+        "contacts:version:1", 7,
+        expire=settings.CONTACTS_CACHE_TTL_COUNT,
+    )
+
+def test_get_contacts_without_count(client, get_token):
+    response = client.get(
+        "/api/contacts", headers={"Authorization": f"Bearer {get_token}"}
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert "X-Total-Count" not in response.headers
+
+def test_get_contacts_invalid_cursor(client, get_token):
+    response = client.get(
+        "/api/contacts?cursor=not-a-cursor",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+    assert response.json()["detail"] == "Invalid cursor"
+
+def test_search_contacts(client, get_token):
+    response = client.get(
+        "/api/contacts?q=KATE",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    data = response.json()
+    assert [contact["email"] for contact in data] == [contacts[1]["email"]]
+
+def test_upcoming_birthdays(client, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+    birthday = (date.today() + timedelta(days=3)).replace(year=2000)
+    response = client.post(
+        "/api/contacts",
+        json={
+            "name": "Birthday",
+            "surname": "Soon",
+            "email": "soon@example.com",
+            "phone": "+380671112233",
+            "birthday": birthday.isoformat(),
+        },
+        headers=headers,
+    )
+    assert response.status_code == status.HTTP_201_CREATED, response.text
+
+    response = client.get("/api/contacts/birthdays/?days=7", headers=headers)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert "soon@example.com" in [item["email"] for item in response.json()]
+
+    response = client.get("/api/contacts/birthdays/?days=400", headers=headers)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert len(response.json()) == 3
+
+    response = client.get("/api/contacts/birthdays/?days=-30", headers=headers)
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+def test_create_contacts_bulk(client, get_token):
+    new_contact = {
+        "name": "Bulk",
+        "surname": "Created",
+        "email": "bulk@example.com",
+        "phone": "+380501112233",
+        "birthday": "1985-03-01",
+    }
+    response = client.post(
+        "/api/contacts/bulk",
+        json=[
+            # Same email as the next item, phone of an existing contact
+            {**new_contact, "phone": contacts[1]["phone"]},
+            new_contact,
+            {key: contacts[1][key] for key in test_contact},
+            {**new_contact, "phone": "not-a-phone"},
+            new_contact,
+        ],
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    data = response.json()
+    assert (data["created"], data["duplicates"], data["invalid"]) == (1, 3, 1)
+    assert [result["status"] for result in data["results"]] == [
+        "duplicate", "created", "duplicate", "invalid", "duplicate"
+    ]
+    assert data["results"][0]["id"] is None
+    created_id = data["results"][1]["id"]
+    assert data["results"][3]["errors"]
+
+    response = client.get(
+        f"/api/contacts/{created_id}",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.json()["phone"] == new_contact["phone"]
+
+def test_export_contacts_ndjson(client, get_token):
+    response = client.get(
+        "/api/contacts/export",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert rows[0]["email"] == contacts[0]["email"]
+    assert len(rows) == 4
+
+def test_export_contacts_csv(client, get_token):
+    response = client.get(
+        "/api/contacts/export?format=csv",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert rows[1]["email"] == contacts[1]["email"]
+    assert len(rows) == 4
+
+def test_import_contacts_csv(client, get_token):
+    content = (
+        "name,surname,email,phone,birthday\n"
+        "Csv,Imported,csv@example.com,+380661234567,1991-02-03\n"
+        "Kate,Doe,kate@example.com,+380675714569,1990-05-25\n"
+        "Broken,Row,not-an-email,+380661234568,1991-02-03\n"
+    )
+    response = client.post(
+        "/api/contacts/import",
+        files={"file": ("contacts.csv", content, "text/csv")},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    data = response.json()
+    assert (data["total"], data["created"], data["duplicates"],
+            data["invalid"]) == (3, 1, 1, 1)
+    assert data["errors"][0]["row"] == 3
+
+def test_import_contacts_vcard(client, get_token):
+    content = (
+        "BEGIN:VCARD\r\n"
+        "VERSION:3.0\r\n"
+        "FN:Vcard Person\r\n"
+        "N:Person;Vcard;;;\r\n"
+        "EMAIL;TYPE=INTERNET:vcard@example.com\r\n"
+        "TEL;TYPE=CELL:+380 66 765 43 21\r\n"
+        "BDAY:19800704\r\n"
+        "NOTE:Imported from\r\n"
+        "  a phone\r\n"
+        "END:VCARD\r\n"
+    )
+    response = client.post(
+        "/api/contacts/import",
+        files={"file": ("contacts.vcf", content, "text/vcard")},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json()["created"] == 1
+
+    response = client.get(
+        "/api/contacts?q=vcard@example.com",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    data = response.json()
+    assert data[0]["phone"] == "+380667654321"
+    assert data[0]["birthday"] == "1980-07-04"
+    assert data[0]["info"] == "Imported from a phone"
+
+def test_import_contacts_failure_progress(client, get_token,
+                                         fake_redis_store):
+    response = client.post(
+        "/api/contacts/import",
+        files={"file": ("contacts.csv", b"name,email\n\xff\xfe\n",
+                        "text/csv")},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+
+    response = client.get(
+        "/api/contacts/import/progress",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json()["status"] == "failed"
+    assert "contacts:import:1:lock" not in fake_redis_store
+
+def test_import_contacts_concurrent(client, get_token, fake_redis_store):
+    fake_redis_store["contacts:import:1:lock"] = {"token": "other"}
+    response = client.post(
+        "/api/contacts/import",
+        files={"file": ("contacts.csv", "name\n", "text/csv")},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_409_CONFLICT, response.text
+
+def test_import_contacts_unsupported_file(client, get_token):
+    response = client.post(
+        "/api/contacts/import",
+        files={"file": ("contacts.txt", "hello", "text/plain")},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+def test_get_contacts_sparse_fields(client, get_token):
+    response = client.get(
+        "/api/contacts?fields=name,phone&limit=1",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json() == [
+        {"id": 1, "name": contacts[0]["name"], "phone": contacts[0]["phone"]}
+    ]
+    assert "X-Next-Cursor" in response.headers
+    assert "ETag" in response.headers
+
+def test_get_contact_sparse_fields(client, get_token):
+    response = client.get(
+        "/api/contacts/1?fields=birthday",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json() == {"id": 1, "birthday": contacts[0]["birthday"]}
+
+def test_get_contacts_unknown_field(client, get_token):
+    response = client.get(
+        "/api/contacts?fields=name,user_id",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+    assert response.json()["detail"] == "Unknown fields: user_id"
+
+def test_contact_changes(client, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+    response = client.get("/api/contacts/changes", headers=headers)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    data = response.json()
+    ids = [contact["id"] for contact in data["changes"]]
+    assert 1 in ids
+    assert data["deleted"] == []
+    assert data["has_more"] is False
+
+    # Changes of possibly still running transactions are sent again
+    response = client.get(
+        f"/api/contacts/changes?since={data['next']}", headers=headers
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert [contact["id"] for contact in response.json()["changes"]] == ids
+    assert response.json()["deleted"] == []
+
+def test_contact_changes_settled(client, get_token, monkeypatch):
+    # A horizon in the future: every change counts as committed
+    monkeypatch.setattr(settings, "CONTACTS_CHANGES_MAX_TXN_AGE", -60)
+    headers = {"Authorization": f"Bearer {get_token}"}
+    response = client.get("/api/contacts/changes", headers=headers)
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    response = client.get(
+        f"/api/contacts/changes?since={response.json()['next']}",
+        headers=headers,
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json()["changes"] == []
+
+def test_contact_changes_invalid_token(client, get_token):
+    response = client.get(
+        "/api/contacts/changes?since=abc",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+
+def test_contact_events_without_redis(client, get_token):
+    response = client.get(
+        "/api/contacts/stream",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+def test_contact_events_stream(client, get_token, monkeypatch):
+    from src.services.events import contact_events
+    from src.services.redis_cache import redis_cache
+
+    async def subscribe(channel, timeout):
+        assert channel == "contacts:events:1"
+        yield {"type": "updated", "ids": [1]}
+        yield None
+
+    redis = AsyncMock()
+    redis.get.return_value = None
+    monkeypatch.setattr(redis_cache, "redis", redis)
+    monkeypatch.setattr(contact_events, "subscribe", subscribe)
+    response = client.get(
+        "/api/contacts/stream",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text == (
+        'event: updated\ndata: {"type": "updated", "ids": [1]}\n\n'
+        ": keep-alive\n\n"
+    )
+
 def test_update_contact(client, get_token):
     response = client.put(
         "/api/contacts/1",
@@ -98,6 +623,64 @@ def test_update_contact_not_found(client, get_token):
     data = response.json()
     assert data["detail"] == "Not Found"
 
+def test_contact_mutation_publishes_event(client, get_token, monkeypatch):
+    from src.services.redis_cache import redis_cache
+
+    publish = AsyncMock()
+    monkeypatch.setattr(redis_cache, "publish", publish)
+    response = client.patch(
+        "/api/contacts/1",
+        json={"info": "Published"},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    publish.assert_awaited_once_with(
+        "contacts:events:1", {"type": "updated", "ids": [1]}
+    )
+
+def test_patch_contact(client, get_token):
+    response = client.patch(
+        "/api/contacts/1",
+        json={"info": "Patched info"},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    data = response.json()
+    assert data["info"] == "Patched info"
+    assert data["name"] == "new_test_contact"
+    assert data["email"] == "new_test@example.com"
+
+def test_patch_contact_empty_body(client, get_token, monkeypatch):
+    from src.services.redis_cache import redis_cache
+
+    bump_version = AsyncMock()
+    monkeypatch.setattr(redis_cache, "bump_version", bump_version)
+    headers = {"Authorization": f"Bearer {get_token}"}
+    response = client.patch("/api/contacts/1", json={}, headers=headers)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json()["info"] == "Patched info"
+    bump_version.assert_not_awaited()
+
+    response = client.patch("/api/contacts/999", json={}, headers=headers)
+    assert response.status_code == status.HTTP_404_NOT_FOUND, response.text
+
+def test_patch_contact_duplicate_email(client, get_token):
+    response = client.patch(
+        "/api/contacts/1",
+        json={"email": contacts[1]["email"]},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+
+def test_patch_contact_not_found(client, get_token):
+    response = client.patch(
+        "/api/contacts/999",
+        json={"info": "Nobody"},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND, response.text
+    assert response.json()["detail"] == "Contact not found"
+
 def test_delete_contact(client, get_token):
     response = client.delete(
         "/api/contacts/1", headers={"Authorization": f"Bearer {get_token}"}
@@ -107,6 +690,19 @@ def test_delete_contact(client, get_token):
     assert data["name"] == "new_test_contact"
     assert "id" in data
 
+def test_contact_changes_tombstones(client, get_token):
+    since = encode_cursor(
+        "2000-01-01T00:00:00", 0, "2000-01-01T00:00:00", 0
+    )
+    response = client.get(
+        f"/api/contacts/changes?since={since}",
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    data = response.json()
+    assert data["deleted"] == [1]
+    assert 1 not in [contact["id"] for contact in data["changes"]]
+
 def test_repeat_delete_tag(client, get_token):
     response = client.delete(
         "/api/contacts/1", headers={"Authorization": f"Bearer {get_token}"}
@@ -115,3 +711,201 @@ def test_repeat_delete_tag(client, get_token):
     data = response.json()
     assert data["detail"] == "Contact not found"
 #
+
+@pytest.fixture
+def fake_redis_store(monkeypatch):
+    from src.services.redis_cache import redis_cache
+
+    store = {}
+
+    async def get(key):
+        return store.get(key)
+
+    async def set(key, value, expire=3600):
+        store[key] = value
+
+    async def add(key, value, expire):
+        return store.setdefault(key, value) is value
+
+    async def delete(key):
+        store.pop(key, None)
+
+    async def delete_if_equals(key, value):
+        if store.get(key) == value:
+            del store[key]
+
+    fakes = {"get": get, "set": set, "add": add, "delete": delete,
+             "delete_if_equals": delete_if_equals}
+    for name, fake in fakes.items():
+        monkeypatch.setattr(redis_cache, name, fake)
+    return store
+
+idempotent_contact = {
+    "name": "Retry",
+    "surname": "Safe",
+    "email": "retry@example.com",
+    "phone": "+380509998877",
+    "birthday": "1991-03-04",
+}
+
+def test_create_contact_idempotency_key_replays(client, get_token,
+                                                fake_redis_store):
+    headers = {
+        "Authorization": f"Bearer {get_token}",
+        "Idempotency-Key": "create-retry-1",
+    }
+    first = client.post("/api/contacts", json=idempotent_contact,
+                        headers=headers)
+    assert first.status_code == status.HTTP_201_CREATED, first.text
+    assert "Idempotent-Replayed" not in first.headers
+
+    retry = client.post("/api/contacts", json=idempotent_contact,
+                        headers=headers)
+    assert retry.status_code == status.HTTP_201_CREATED, retry.text
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert retry.json() == first.json()
+    assert not any(key.endswith(":lock") for key in fake_redis_store)
+
+def test_idempotency_key_reused_for_other_request(client, get_token,
+                                                  fake_redis_store):
+    headers = {
+        "Authorization": f"Bearer {get_token}",
+        "Idempotency-Key": "create-retry-2",
+    }
+    first = client.post("/api/contacts", json=idempotent_contact,
+                        headers=headers)
+    assert first.status_code == status.HTTP_400_BAD_REQUEST, first.text
+
+    other = client.post(
+        "/api/contacts",
+        json={**idempotent_contact, "email": "other@example.com"},
+        headers=headers,
+    )
+    assert other.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert "different request" in other.json()["detail"]
+
+def test_idempotency_key_in_flight(client, get_token, fake_redis_store):
+    fake_redis_store["idempotency:1:update-1:lock"] = {}
+    response = client.put(
+        "/api/contacts/2",
+        json=idempotent_contact,
+        headers={
+            "Authorization": f"Bearer {get_token}",
+            "Idempotency-Key": "update-1",
+        },
+    )
+    assert response.status_code == status.HTTP_409_CONFLICT, response.text
+
+def test_idempotency_key_saved_before_lock(client, get_token,
+                                           fake_redis_store, monkeypatch):
+    """A retry locking after the first request finished must replay it."""
+    from src.services.redis_cache import redis_cache
+
+    stored = {"status": 201, "body": {"id": 42}}
+    add = redis_cache.add
+
+    async def add_after_first_request(key, value, expire):
+        fake_redis_store["idempotency:1:create-retry-3"] = {
+            **stored, "fingerprint": request_fingerprint(
+                "POST", "/api/contacts/", idempotent_contact
+            ),
+        }
+        return await add(key, value, expire)
+
+    monkeypatch.setattr(redis_cache, "add", add_after_first_request)
+    response = client.post(
+        "/api/contacts",
+        json=idempotent_contact,
+        headers={
+            "Authorization": f"Bearer {get_token}",
+            "Idempotency-Key": "create-retry-3",
+        },
+    )
+    assert response.status_code == status.HTTP_201_CREATED, response.text
+    assert response.headers["Idempotent-Replayed"] == "true"
+    assert response.json() == {"id": 42}
+    assert "idempotency:1:create-retry-3:lock" not in fake_redis_store
+
+@pytest.mark.asyncio
+async def test_idempotency_unlock_keeps_lock_of_other_request(
+    fake_redis_store
+):
+    user = User(id=1)
+    first = IdempotencyStore(user, "expired")
+    await first.lock()
+    # The lock expired and a retry took it over
+    del fake_redis_store[first.lock_key]
+    retry = IdempotencyStore(user, "expired")
+    await retry.lock()
+
+    await first.unlock()
+    assert fake_redis_store[retry.lock_key] == retry.lock_value
+
+    await retry.unlock()
+    assert retry.lock_key not in fake_redis_store
+
+def test_contact_counter_follows_writes(client, get_token, monkeypatch):
+    from src.services.redis_cache import redis_cache
+
+    delete = AsyncMock()
+    monkeypatch.setattr(redis_cache, "delete", delete)
+    headers = {"Authorization": f"Bearer {get_token}"}
+    response = client.post(
+        "/api/contacts",
+        json={**idempotent_contact, "email": "counted@example.com",
+              "phone": "+380501110000"},
+        headers=headers,
+    )
+    assert response.status_code == status.HTTP_201_CREATED, response.text
+    delete.assert_awaited_once_with("contacts:count:1")
+
+    response = client.delete(
+        f"/api/contacts/{response.json()['id']}", headers=headers
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert delete.await_count == 2
+
+def test_contact_counter_recount_during_write(client, get_token,
+                                              fake_redis_store, monkeypatch):
+    """A recount that already saw a commit must not be adjusted again."""
+    from src.repository.contacts import ContactRepository
+    from src.services.redis_cache import redis_cache
+
+    async def get_version(key):
+        return fake_redis_store.setdefault(key, 1)
+
+    async def bump_version(key):
+        fake_redis_store[key] = await get_version(key) + 1
+
+    async def add_if_version(key, value, version_key, version, expire):
+        if fake_redis_store.get(version_key) == version:
+            fake_redis_store.setdefault(key, value)
+
+    monkeypatch.setattr(redis_cache, "get_version", get_version)
+    monkeypatch.setattr(redis_cache, "bump_version", bump_version)
+    monkeypatch.setattr(redis_cache, "add_if_version", add_if_version)
+    headers = {"Authorization": f"Bearer {get_token}"}
+    count = ContactRepository.count_contacts
+
+    async def count_with_pending_commit(self, user, *args):
+        # The create below has committed but not yet bumped the version
+        return await count(self, user, *args) + 1
+
+    monkeypatch.setattr(ContactRepository, "count_contacts",
+                        count_with_pending_commit)
+    response = client.get("/api/contacts?limit=1&count=true",
+                          headers=headers)
+    total = int(response.headers["X-Total-Count"])
+    monkeypatch.setattr(ContactRepository, "count_contacts", count)
+
+    response = client.post(
+        "/api/contacts",
+        json={**idempotent_contact, "email": "interleaved@example.com",
+              "phone": "+380501110001"},
+        headers=headers,
+    )
+    assert response.status_code == status.HTTP_201_CREATED, response.text
+
+    response = client.get("/api/contacts?limit=1&count=true",
+                          headers=headers)
+    assert response.headers["X-Total-Count"] == str(total)
@@ -1,3 +1,5 @@
+from collections import defaultdict
+
 import pytest
 from unittest.mock import AsyncMock
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -6,6 +8,30 @@ from main import app
 from src.database.database import get_db
 
 
+def test_cache_stats(client, get_token, monkeypatch):
+    """
+    Test reading cache hit/miss counters as an administrator.
+
+    Expected:
+    - 200 status code
+    - Counters and hit ratio for every recorded cache, including the
+      user cache tiers consulted while authenticating the request
+    """
+    monkeypatch.setattr("src.services.redis_cache.cache_stats.hits",
+                        defaultdict(int, {"contacts:list": 3}))
+    monkeypatch.setattr("src.services.redis_cache.cache_stats.misses",
+                        defaultdict(int, {"contacts:list": 1}))
+    response = client.get(
+        "/api/cache/stats", headers={"Authorization": f"Bearer {get_token}"}
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    stats = response.json()
+    assert stats["contacts:list"] == {
+        "hits": 3, "misses": 1, "hit_ratio": 0.75
+    }
+    assert stats["user:local"]["hits"] + stats["user:local"]["misses"] == 1
+
+
 def test_healthchecker_success(client):
     """
     Test healthchecker when the database connection is successful.
@@ -0,0 +1,146 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from redis.exceptions import RedisError
+
+from src.database.models import User
+from src.services import user_cache
+from src.services.local_cache import LocalCache
+
+
+def test_local_cache_evicts_least_recently_used():
+    """Тест витіснення найдавніше використаного запису."""
+    cache = LocalCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_local_cache_expires_entries(monkeypatch):
+    """Тест завершення терміну дії запису."""
+    now = [100.0]
+    monkeypatch.setattr("src.services.local_cache.time.monotonic",
+                        lambda: now[0])
+    cache = LocalCache(maxsize=10, ttl=5)
+    cache.set("a", None)
+    assert cache.get("a", "missing") is None
+
+    now[0] += 5
+
+    assert cache.get("a", "missing") == "missing"
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_cached_user_fills_local_tier(monkeypatch):
+    """Тест копіювання користувача з Redis у кеш процесу."""
+    monkeypatch.setattr(user_cache, "local_users", LocalCache(10, 60))
+    redis_get = AsyncMock(return_value={
+        "id": 1, "username": "alice", "email": "alice@example.com",
+        "is_verified": True, "role": "user",
+    })
+    monkeypatch.setattr(user_cache.redis_cache, "get", redis_get)
+
+    first = await user_cache.get_cached_user("alice")
+    second = await user_cache.get_cached_user("alice")
+
+    assert first.id == 1
+    assert second is first
+    redis_get.assert_awaited_once_with("user:alice")
+
+
+@pytest.mark.asyncio
+async def test_invalidate_user_notifies_workers(monkeypatch):
+    """Тест видалення користувача з обох рівнів кешу."""
+    local_users = LocalCache(10, 60)
+    local_users.set("alice", object())
+    monkeypatch.setattr(user_cache, "local_users", local_users)
+    delete = AsyncMock()
+    publish = AsyncMock()
+    monkeypatch.setattr(user_cache.redis_cache, "delete", delete)
+    monkeypatch.setattr(user_cache.redis_cache, "publish", publish)
+
+    await user_cache.invalidate_user("alice")
+
+    assert local_users.get("alice") is None
+    delete.assert_awaited_once_with("user:alice")
+    publish.assert_awaited_once_with(
+        user_cache.USER_EVENTS_CHANNEL, {"username": "alice"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_cache_user_keeps_newer_entry(monkeypatch):
+    """Тест: заповнення кешу не перезаписує новіший запис."""
+    local_users = LocalCache(10, 60)
+    monkeypatch.setattr(user_cache, "local_users", local_users)
+    add = AsyncMock(return_value=False)
+    monkeypatch.setattr(user_cache.redis_cache, "add", add)
+    stale = User(id=1, username="alice", email="alice@example.com",
+                 is_verified=False, role="user")
+
+    await user_cache.cache_user(stale)
+
+    key, value = add.await_args.args
+    assert key == "user:alice"
+    assert value["is_verified"] is False
+    assert local_users.get("alice") is None
+
+
+def test_user_ttl_is_jittered(monkeypatch):
+    """Тест розкиду TTL записів користувачів."""
+    monkeypatch.setattr(user_cache.settings, "USER_CACHE_TTL", 1000)
+    monkeypatch.setattr(user_cache.settings, "USER_CACHE_TTL_JITTER", 0.1)
+
+    ttls = {user_cache.user_ttl() for _ in range(200)}
+
+    assert all(900 <= ttl <= 1100 for ttl in ttls)
+    assert len(ttls) > 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_user_writes_through(monkeypatch):
+    """Тест оновлення кешу після зміни користувача."""
+    local_users = LocalCache(10, 60)
+    monkeypatch.setattr(user_cache, "local_users", local_users)
+    redis_set = AsyncMock()
+    publish = AsyncMock()
+    monkeypatch.setattr(user_cache.redis_cache, "set", redis_set)
+    monkeypatch.setattr(user_cache.redis_cache, "publish", publish)
+    user = User(id=1, username="alice", email="alice@example.com",
+                is_verified=True, role="user")
+
+    await user_cache.refresh_user(user)
+
+    key, value = redis_set.await_args.args
+    assert key == "user:alice"
+    assert value["is_verified"] is True
+    assert local_users.get("alice").email == "alice@example.com"
+    publish.assert_awaited_once_with(
+        user_cache.USER_EVENTS_CHANNEL, {"username": "alice"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_refresh_user_survives_redis_outage(monkeypatch):
+    """Тест оновлення користувача, коли Redis недоступний."""
+    local_users = LocalCache(10, 60)
+    local_users.set("alice", object())
+    monkeypatch.setattr(user_cache, "local_users", local_users)
+    outage = AsyncMock(side_effect=RedisError("down"))
+    for name in ("set", "delete", "publish"):
+        monkeypatch.setattr(user_cache.redis_cache, name, outage)
+    user = User(id=1, username="alice", email="alice@example.com",
+                is_verified=True, role="user")
+
+    await user_cache.refresh_user(user)
+
+    assert local_users.get("alice") is None
+    outage.assert_any_await("user:alice")